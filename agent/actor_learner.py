@@ -0,0 +1,183 @@
+import copy
+import queue
+import time
+import traceback
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+from .buffer import RolloutBuffer
+from .runner import collect_rollouts
+from .workers import _seed_all, _worker_seed
+
+
+def _actor_loop(actor_id, seed, env_class, collect, episodes_per_batch, shared_policy, shared_value,
+                version, weights_lock, slots, free_slots, full_slots, stop):
+    """Keep filling free slots with episodes from the latest published policy.
+
+    Each batch goes to the learner as (actor, slot, steps, policy version,
+    collection CPU seconds, error); the trajectories stay in the shared slot.
+    """
+    torch.set_num_threads(1)
+    _seed_all(_worker_seed(seed, 0, actor_id))
+    policy_net = copy.deepcopy(shared_policy)
+    value_net = copy.deepcopy(shared_value)
+    local_version = -1
+
+    while not stop.is_set():
+        try:
+            slot = free_slots.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        try:
+            with weights_lock:
+                if version.value != local_version:
+                    policy_net.load_state_dict(shared_policy.state_dict())
+                    if value_net is not None:
+                        value_net.load_state_dict(shared_value.state_dict())
+                    local_version = version.value
+
+            start = time.process_time()
+            buffer = slots[slot]
+            buffer.reset()
+            collect(env_class, policy_net, value_net, num_episodes=episodes_per_batch, buffer=buffer)
+            message = (actor_id, slot, buffer.size, local_version, time.process_time() - start, None)
+        except Exception:
+            message = (actor_id, slot, 0, local_version, 0.0, traceback.format_exc())
+
+        # Bounded queue: block while the learner is behind, but keep watching for stop
+        while not stop.is_set():
+            try:
+                full_slots.put(message, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+
+class ActorLearner:
+    """Asynchronous PPO: actor processes collect while the learner updates.
+
+    num_actors processes keep collecting episodes_per_batch episodes at a time
+    with the most recently published weights. Each batch goes into a
+    shared-memory RolloutBuffer slot, and at most queue_depth filled batches
+    wait for the learner. step() takes the next batch, drops it if it lags
+    more than max_staleness published versions behind, updates the agent with
+    importance ratios truncated at behavior_clip, and publishes the weights
+    every publish_every updates.
+    """
+
+    def __init__(self, env_class, agent, num_actors=2, episodes_per_batch=150, queue_depth=2,
+                 max_staleness=2, publish_every=1, behavior_clip=2.0, seed=None, collect=collect_rollouts):
+        self.agent = agent
+        self.num_actors = num_actors
+        self.max_staleness = max_staleness
+        self.publish_every = publish_every
+        self.behavior_clip = behavior_clip
+        seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2 ** 32)
+
+        self.shared_policy = copy.deepcopy(agent.policy_net).cpu().share_memory()
+        self.shared_value = (copy.deepcopy(agent.value_net).cpu().share_memory()
+                             if agent.value_net is not None else None)
+        self.version = mp.Value('i', 0)
+        self.weights_lock = mp.Lock()
+
+        # One slot being filled per actor, queue_depth waiting and one held by the learner
+        obs_dim = self.shared_policy.fc1.in_features
+        self.slots = [RolloutBuffer.for_episodes(episodes_per_batch, obs_dim=obs_dim).share_memory_()
+                      for _ in range(num_actors + queue_depth + 1)]
+        self.free_slots = mp.Queue()
+        for slot in range(len(self.slots)):
+            self.free_slots.put(slot)
+        self.full_slots = mp.Queue(maxsize=queue_depth)
+        self.stop = mp.Event()
+
+        self.updates = 0
+        self.dropped = 0
+        self.staleness = []
+        self.actor_time = 0.0
+        self.learner_time = 0.0
+        self.start_time = time.perf_counter()
+        self.actors = [
+            mp.Process(target=_actor_loop, daemon=True,
+                       args=(i, seed, env_class, collect, episodes_per_batch, self.shared_policy, self.shared_value,
+                             self.version, self.weights_lock, self.slots, self.free_slots, self.full_slots,
+                             self.stop))
+            for i in range(num_actors)
+        ]
+        for actor in self.actors:
+            actor.start()
+
+    def publish(self):
+        """Copy the agent's weights to the actors and bump the policy version."""
+        with self.weights_lock:
+            self.shared_policy.load_state_dict(self.agent.policy_net.state_dict())
+            if self.shared_value is not None:
+                self.shared_value.load_state_dict(self.agent.value_net.state_dict())
+            self.version.value += 1
+
+    def next_batch(self):
+        """Block for the next batch within max_staleness; returns (slot, staleness)."""
+        while True:
+            actor_id, slot, size, version, seconds, error = self.full_slots.get()
+            self.actor_time += seconds
+            if error is not None:
+                self.free_slots.put(slot)
+                raise RuntimeError(f"actor {actor_id} failed\n{error}")
+            staleness = self.version.value - version
+            if staleness > self.max_staleness:
+                self.dropped += 1
+                self.free_slots.put(slot)
+                continue
+            self.slots[slot].size = size
+            return slot, staleness
+
+    def step(self, device='cpu'):
+        """Run one learner update on the next batch and return its stats."""
+        slot, staleness = self.next_batch()
+        start = time.process_time()
+        buffer = self.slots[slot]
+        if torch.device(device).type != 'cpu':
+            buffer = {key: buffer[key].to(device) for key in RolloutBuffer.fields}
+
+        stats = self.agent.update(buffer, behavior_clip=self.behavior_clip)
+        stats['rewards_sum'] = buffer['rewards'].sum().item()
+        stats['rewards_mean'] = buffer['rewards'].mean().item()
+        stats['staleness'] = staleness
+        self.staleness.append(staleness)
+        self.free_slots.put(slot)
+
+        self.updates += 1
+        if self.updates % self.publish_every == 0:
+            self.publish()
+        self.learner_time += time.process_time() - start
+        return stats
+
+    def stats(self):
+        """Throughput and overlap since start.
+
+        overlap is the CPU time actors spent collecting plus the time the
+        learner spent updating, per second of wall time: at most 1 when the
+        phases alternate on one core, up to num_actors + 1 when they fully
+        overlap. learner_utilization is the learner's share alone.
+        """
+        wall = time.perf_counter() - self.start_time
+        return {
+            'updates': self.updates,
+            'dropped_batches': self.dropped,
+            'mean_staleness': float(np.mean(self.staleness)) if self.staleness else 0.0,
+            'wall_time': wall,
+            'overlap': (self.actor_time + self.learner_time) / wall,
+            'learner_utilization': self.learner_time / wall,
+        }
+
+    def close(self):
+        self.stop.set()
+        for actor in self.actors:
+            actor.join(timeout=5)
+            if actor.is_alive():
+                actor.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
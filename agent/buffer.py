@@ -0,0 +1,100 @@
+import torch
+
+# Longest possible episode: every step either draws a card into the hand or empties the deck
+MAX_EPISODE_STEPS = 5
+
+
+class RolloutBuffer:
+    """Fixed-capacity rollout storage written in place, one row per step.
+
+    Fields are preallocated tensors of `capacity` rows; buffer[key] returns a
+    view of the rows written so far, so the buffer can be handed to
+    PPOAgent.update without stacking or copying. episode_ends records the row
+    after each completed episode.
+    """
+
+    fields = ('obs', 'actions', 'log_probs', 'rewards', 'values', 'dones')
+
+    def __init__(self, capacity, obs_dim=161, num_actions=52, device='cpu'):
+        self.capacity = capacity
+        self.obs = torch.zeros((capacity, obs_dim), device=device)
+        self.actions = torch.zeros((capacity, num_actions), device=device)
+        self.log_probs = torch.zeros(capacity, device=device)
+        self.rewards = torch.zeros((capacity, 1), device=device)
+        self.values = torch.zeros((capacity, 1), device=device)
+        self.dones = torch.zeros((capacity, 1), device=device)
+        self.size = 0
+        self.episode_ends = []
+        self._bind_arrays()
+
+    def _bind_arrays(self):
+        # NumPy views of CPU storage make single-row writes much cheaper than tensor indexing
+        if self.obs.device.type == 'cpu':
+            self._arrays = [getattr(self, key).numpy() for key in self.fields]
+        else:
+            self._arrays = None
+
+    @classmethod
+    def for_episodes(cls, num_episodes, **kwargs):
+        """A buffer large enough for num_episodes episodes of any length."""
+        return cls(num_episodes * MAX_EPISODE_STEPS, **kwargs)
+
+    def reset(self):
+        self.size = 0
+        self.episode_ends = []
+
+    def share_memory_(self):
+        for key in self.fields:
+            getattr(self, key).share_memory_()
+        self._bind_arrays()
+        return self
+
+    def add(self, obs, action, log_prob, reward, value, done):
+        """Write one step into the next row."""
+        if self.size == self.capacity:
+            raise RuntimeError(f"RolloutBuffer is full ({self.capacity} steps)")
+        i = self.size
+        if self._arrays is not None:
+            obs_rows, action_rows, log_prob_rows, reward_rows, value_rows, done_rows = self._arrays
+            obs_rows[i] = obs.numpy()
+            action_rows[i] = action.numpy()
+            log_prob_rows[i] = log_prob.item()
+            reward_rows[i, 0] = reward
+            value_rows[i] = value.numpy()
+            done_rows[i, 0] = done
+        else:
+            self.obs[i] = obs
+            self.actions[i] = action
+            self.log_probs[i] = log_prob
+            self.rewards[i, 0] = reward
+            self.values[i] = value
+            self.dones[i, 0] = float(done)
+        self.size += 1
+        if done:
+            self.episode_ends.append(self.size)
+
+    def add_episodes(self, lengths, obs, actions, log_probs, rewards, values, dones):
+        """Write complete episodes stored back to back; lengths gives each episode's rows."""
+        start, end = self.size, self.size + len(obs)
+        if end > self.capacity:
+            raise RuntimeError(f"RolloutBuffer is full ({self.capacity} steps)")
+        for key, rows in zip(self.fields, (obs, actions, log_probs, rewards, values, dones)):
+            getattr(self, key)[start:end] = rows
+        self.size = end
+        for length in lengths:
+            start += int(length)
+            self.episode_ends.append(start)
+
+    def __getitem__(self, key):
+        if key not in self.fields:
+            raise KeyError(key)
+        return getattr(self, key)[:self.size]
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def keys(self):
+        return self.fields
+
+    def items(self):
+        return [(key, self[key]) for key in self.fields]
@@ -0,0 +1,137 @@
+import copy
+import json
+import os
+import queue
+import random
+import threading
+import numpy as np
+import torch
+
+
+def rng_state():
+    """RNG states of random, numpy and torch (and CUDA when available)."""
+    state = {
+        'python': random.getstate(),
+        'numpy': np.random.get_state(),
+        'torch': torch.get_rng_state(),
+    }
+    if torch.cuda.is_available():
+        state['cuda'] = torch.cuda.get_rng_state_all()
+    return state
+
+
+def set_rng_state(state):
+    random.setstate(state['python'])
+    np.random.set_state(state['numpy'])
+    torch.set_rng_state(state['torch'])
+    if 'cuda' in state and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(state['cuda'])
+
+
+def _cpu_copy(state_dict):
+    return {key: value.detach().cpu().clone() if torch.is_tensor(value) else copy.deepcopy(value)
+            for key, value in state_dict.items()}
+
+
+def cpu_state_dict(module):
+    """A CPU copy of module's state dict that later training steps won't modify."""
+    return _cpu_copy(module.state_dict())
+
+
+def _cpu_optimizer_state(optimizer):
+    state = optimizer.state_dict()
+    return {
+        'state': {key: _cpu_copy(value) for key, value in state['state'].items()},
+        'param_groups': copy.deepcopy(state['param_groups']),
+    }
+
+
+def capture_training_state(agent, iteration, metrics):
+    """Snapshot everything needed to resume once `iteration` iterations have run.
+
+    Tensors are copied to the CPU here, on the training thread, so training can
+    continue while the snapshot is written.
+    """
+    return {
+        'iteration': iteration,
+        'metrics': copy.deepcopy(metrics),
+        'policy_net': cpu_state_dict(agent.policy_net),
+        'value_net': cpu_state_dict(agent.value_net) if agent.value_net is not None else None,
+        'policy_optimizer': _cpu_optimizer_state(agent.policy_optimizer),
+        'value_optimizer': (_cpu_optimizer_state(agent.value_optimizer)
+                            if agent.value_optimizer is not None else None),
+        'rng': rng_state(),
+    }
+
+
+def restore_training_state(agent, state):
+    """Load a captured state into agent and the global RNGs; returns (iteration, metrics)."""
+    agent.policy_net.load_state_dict(state['policy_net'])
+    agent.policy_optimizer.load_state_dict(state['policy_optimizer'])
+    if agent.value_net is not None:
+        agent.value_net.load_state_dict(state['value_net'])
+        agent.value_optimizer.load_state_dict(state['value_optimizer'])
+    set_rng_state(state['rng'])
+    return state['iteration'], state['metrics']
+
+
+def load_checkpoint(path):
+    return torch.load(path, map_location='cpu', weights_only=False)
+
+
+def atomic_write(path, obj):
+    """Write obj to path via a temporary file and a rename, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    if path.endswith('.json'):
+        with open(tmp_path, 'w') as f:
+            json.dump(obj, f)
+    else:
+        torch.save(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+class CheckpointWriter:
+    """Write checkpoints from a background thread.
+
+    submit() hands an already captured object to the writer thread and
+    returns; at most max_pending writes wait before submit blocks. Errors from
+    the thread are raised on the next submit() or close().
+    """
+
+    def __init__(self, max_pending=2):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    atomic_write(*item)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"checkpoint write failed: {error}") from error
+
+    def submit(self, path, obj):
+        self._raise_error()
+        self._queue.put((path, obj))
+
+    def flush(self):
+        """Block until every submitted write is on disk."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
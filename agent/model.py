@@ -30,3 +30,22 @@ class ValueNetwork(nn.Module):
         x = F.relu(self.fc1(x))
         x = F.relu(self.fc2(x))
         return self.out(x)
+
+
+class ActorCriticNetwork(nn.Module):
+    """Shared trunk with policy logits over 52 cards and a scalar value head.
+
+    forward returns (logits, value), so one pass serves both PPO losses.
+    """
+
+    def __init__(self, input_dim=161, hidden_dim=256, output_dim=52):
+        super(ActorCriticNetwork, self).__init__()
+        self.fc1 = nn.Linear(input_dim, hidden_dim)
+        self.fc2 = nn.Linear(hidden_dim, hidden_dim)
+        self.policy_head = nn.Linear(hidden_dim, output_dim)
+        self.value_head = nn.Linear(hidden_dim, 1)
+
+    def forward(self, x):
+        x = F.relu(self.fc1(x))
+        x = F.relu(self.fc2(x))
+        return self.policy_head(x), self.value_head(x)
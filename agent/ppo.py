@@ -1,9 +1,53 @@
+import time
 import torch
 import torch.nn.functional as F
 
 
+def reverse_linear_scan(x, a):
+    """Solve y[t] = x[t] + a[t] * y[t + 1] along dim 0, with y[T] = 0.
+
+    Uses a log-depth scan: after the pass with offset k, each (a[t], y[t])
+    covers steps t..t+2k-1, so at most log2(T) whole-tensor passes replace the
+    T-step Python loop. It stops early once every span reaches a zero
+    coefficient (an episode boundary).
+    """
+    y = x.clone()
+    a = a.clone()
+    offset = 1
+    while offset < len(y) and a[:-offset].any():
+        y[:-offset] += a[:-offset] * y[offset:]
+        a[:-offset] = a[:-offset] * a[offset:]
+        offset *= 2
+    return y
+
+
+def bernoulli_log_prob(logits, actions, legal=None):
+    """Summed log-probability of multi-binary actions, computed stably from logits.
+
+    Cards outside the legal mask are never selected during rollouts, so they
+    contribute nothing.
+    """
+    logp = -F.binary_cross_entropy_with_logits(logits, actions, reduction='none')
+    if legal is not None:
+        logp = logp * legal
+    return logp.sum(dim=-1)
+
+
+def bernoulli_entropy(logits, legal=None):
+    """Summed entropy of independent Bernoullis: softplus(l) - l * sigmoid(l) per legal card."""
+    entropy = F.softplus(logits) - logits * torch.sigmoid(logits)
+    if legal is not None:
+        entropy = entropy * legal
+    return entropy.sum(dim=-1)
+
+
 class PPOAgent:
-    """PPO agent for multi-binary action space (52-card selection)."""
+    """PPO agent for multi-binary action space (52-card selection).
+
+    With value_net=None, policy_net is a shared-trunk actor-critic returning
+    (logits, value) from one forward pass; its value_head trains at value_lr
+    and everything else at policy_lr.
+    """
 
     def __init__(self, policy_net, value_net,
                  policy_lr=3e-4, value_lr=1e-3,
@@ -14,28 +58,57 @@ class PPOAgent:
         self.value_coef = value_coef
         self.entropy_coef = entropy_coef
 
-        self.policy_optimizer = torch.optim.Adam(policy_net.parameters(), lr=policy_lr)
-        self.value_optimizer = torch.optim.Adam(value_net.parameters(), lr=value_lr)
-
-    def compute_returns_and_advantages(self, rewards, values, dones, gamma=0.99, lam=1.0):
-        """Compute GAE advantages and bootstrapped returns."""
-        returns, advantages = [], []
-        gae = 0
-        next_value = 0
-
-        for t in reversed(range(len(rewards))):
-            mask = 1.0 - dones[t].item()
-            delta = rewards[t] + gamma * next_value * mask - values[t]
-            gae = delta + gamma * lam * mask * gae
-            next_value = values[t]
-
-            advantages.insert(0, gae)
-            returns.insert(0, gae + values[t])
-
-        return torch.stack(returns), torch.stack(advantages)
-
-    def update(self, buffer, epochs=4, batch_size=64):
-        """Perform PPO update using collected rollout buffer."""
+        if value_net is None:
+            value_params = list(policy_net.value_head.parameters())
+            value_ids = {id(p) for p in value_params}
+            self.policy_optimizer = torch.optim.Adam([
+                {'params': [p for p in policy_net.parameters() if id(p) not in value_ids], 'lr': policy_lr},
+                {'params': value_params, 'lr': value_lr},
+            ])
+            self.value_optimizer = None
+        else:
+            self.policy_optimizer = torch.optim.Adam(policy_net.parameters(), lr=policy_lr)
+            self.value_optimizer = torch.optim.Adam(value_net.parameters(), lr=value_lr)
+        self.optimizers = [opt for opt in (self.policy_optimizer, self.value_optimizer) if opt is not None]
+
+    def evaluate(self, obs):
+        """Return (logits, values) for a batch of observations."""
+        if self.value_net is None:
+            logits, values = self.policy_net(obs)
+        else:
+            logits, values = self.policy_net(obs), self.value_net(obs)
+        return logits, values.squeeze(-1)
+
+    def compute_returns_and_advantages(self, rewards, values, dones, gamma=0.99, lam=1.0, last_values=None):
+        """Compute GAE advantages and bootstrapped returns.
+
+        Inputs are [T], [T, 1] or [T, N] tensors with time along dim 0; each of
+        the N columns is an independent env. last_values bootstraps the step
+        after T (zero by default, i.e. every trajectory ends in the buffer).
+        """
+        masks = 1.0 - dones.to(values.dtype)
+        next_values = torch.zeros_like(values)
+        next_values[:-1] = values[1:]
+        if last_values is not None:
+            next_values[-1] = last_values
+
+        deltas = rewards + gamma * next_values * masks - values
+        advantages = reverse_linear_scan(deltas, gamma * lam * masks)
+        return advantages + values, advantages
+
+    def update(self, buffer, epochs=4, batch_size=64, shuffle=True, behavior_clip=None):
+        """Perform PPO update using collected rollout buffer.
+
+        Minibatches are drawn from a fresh permutation every epoch unless
+        shuffle is False. Returns the wall-clock time of the update and the
+        samples/sec it processed.
+
+        behavior_clip handles rollouts from a stale policy: the PPO ratio is
+        taken against the current policy at the start of the update, and each
+        sample's loss is weighted by its importance ratio to the policy that
+        collected it, truncated at behavior_clip.
+        """
+        start_time = time.perf_counter()
         obs = buffer['obs']
         actions = buffer['actions']
         old_logp = buffer['log_probs']
@@ -44,14 +117,26 @@ class PPOAgent:
         dones = buffer['dones']
 
         returns, advantages = self.compute_returns_and_advantages(rewards, values, dones)
+        returns = returns.reshape(-1)
+        advantages = advantages.reshape(-1)
         advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
 
-        indices = torch.arange(len(obs))
+        num_samples = len(obs)
+        weights = None
+        if behavior_clip is not None:
+            with torch.no_grad():
+                behavior_logp = old_logp
+                old_logp = bernoulli_log_prob(self.evaluate(obs)[0], actions, obs[:, :52])
+                weights = torch.exp(old_logp - behavior_logp).clamp(max=behavior_clip)
 
         for _ in range(epochs):
-            for start in range(0, len(obs), batch_size):
-                end = start + batch_size
-                idx = indices[start:end]
+            if shuffle:
+                indices = torch.randperm(num_samples, device=obs.device)
+            else:
+                indices = torch.arange(num_samples, device=obs.device)
+
+            for start in range(0, num_samples, batch_size):
+                idx = indices[start:start + batch_size]
 
                 batch_obs = obs[idx]
                 batch_actions = actions[idx]
@@ -59,30 +144,34 @@ class PPOAgent:
                 batch_returns = returns[idx]
                 batch_advantages = advantages[idx]
 
-                logits = self.policy_net(batch_obs)
-                probs = torch.sigmoid(logits)
+                logits, values_pred = self.evaluate(batch_obs)
+                # The observation starts with the deck mask, i.e. the cards that could be chosen
+                legal = batch_obs[:, :52]
 
                 # Multi-binary log probs
-                logp = (
-                        batch_actions * torch.log(probs + 1e-8) +
-                        (1 - batch_actions) * torch.log(1 - probs + 1e-8)
-                ).sum(dim=-1)
+                logp = bernoulli_log_prob(logits, batch_actions, legal)
 
                 ratio = torch.exp(logp - batch_old_logp)
                 clipped = torch.clamp(ratio, 1 - self.clip_eps, 1 + self.clip_eps)
-                policy_loss = -torch.min(ratio * batch_advantages, clipped * batch_advantages).mean()
+                surrogate = torch.min(ratio * batch_advantages, clipped * batch_advantages)
+                if weights is not None:
+                    surrogate = weights[idx] * surrogate
+                policy_loss = -surrogate.mean()
 
-                values_pred = self.value_net(batch_obs).squeeze()
-                value_loss = F.mse_loss(values_pred, batch_returns.squeeze())
+                value_loss = F.mse_loss(values_pred, batch_returns)
 
-                entropy = -(
-                        probs * torch.log(probs + 1e-8) +
-                        (1 - probs) * torch.log(1 - probs + 1e-8)
-                ).sum(dim=-1).mean()
+                entropy = bernoulli_entropy(logits, legal).mean()
                 total_loss = policy_loss + self.value_coef * value_loss - self.entropy_coef * entropy
 
-                self.policy_optimizer.zero_grad()
-                self.value_optimizer.zero_grad()
+                for optimizer in self.optimizers:
+                    optimizer.zero_grad()
                 total_loss.backward()
-                self.policy_optimizer.step()
-                self.value_optimizer.step()
+                for optimizer in self.optimizers:
+                    optimizer.step()
+
+        elapsed = time.perf_counter() - start_time
+        stats = {'update_time': elapsed, 'samples_per_sec': epochs * num_samples / elapsed}
+        if weights is not None:
+            stats['importance_weight'] = weights.mean().item()
+            stats['importance_clipped'] = (weights == behavior_clip).float().mean().item()
+        return stats
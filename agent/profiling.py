@@ -0,0 +1,129 @@
+import cProfile
+import functools
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+_NULL_PHASE = nullcontext()
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'units', 'start')
+
+    def __init__(self, profiler, name, units):
+        self.profiler = profiler
+        self.name = name
+        self.units = units
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start, self.units)
+
+
+class PhaseProfiler:
+    """Per-iteration wall time and call counts of named training phases.
+
+    Code marks phases with `with PROFILER.phase(name):`; while disabled that
+    returns a shared no-op context. instrument() wraps existing functions (env
+    steps, hand evaluation) only while enabled, so they cost nothing otherwise.
+    Phases nest, and each reports inclusive time. end_iteration() appends one
+    JSON line per iteration to log_path and can run chosen iterations under
+    cProfile, dumping profile_iter<N>.prof next to the log.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.log_path = None
+        self.profile_iterations = set()
+        self._patches = []
+        self._reset()
+
+    def _reset(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.units = defaultdict(int)
+        self._iteration_start = time.perf_counter()
+        self._cprofile = None
+
+    def enable(self, log_path, profile_iterations=()):
+        self.enabled = True
+        self.log_path = log_path
+        self.profile_iterations = set(profile_iterations)
+        self._reset()
+
+    def disable(self):
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches = []
+        self.enabled = False
+
+    def phase(self, name, units=1):
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name, units)
+
+    def record(self, name, seconds, units=1):
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+        self.units[name] += units
+
+    def instrument(self, owner, attr, name, units=None):
+        """Time owner.attr (a function or method) as phase `name` until disable().
+
+        units(*args, **kwargs), if given, counts the work items of a call,
+        e.g. the games in a vectorized step.
+        """
+        original = getattr(owner, attr)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start, units(*args, **kwargs) if units else 1)
+
+        self._patches.append((owner, attr, original))
+        setattr(owner, attr, timed)
+
+    def start_iteration(self, iteration):
+        if not self.enabled:
+            return
+        self._reset()
+        if iteration in self.profile_iterations:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def end_iteration(self, iteration, **metrics):
+        """Write this iteration's JSON line and return the record (None while disabled)."""
+        if not self.enabled:
+            return None
+        wall = time.perf_counter() - self._iteration_start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(os.path.join(os.path.dirname(self.log_path) or ".",
+                                                   f"profile_iter{iteration}.prof"))
+
+        env_steps = self.units.get('env_step', 0)
+        eval_calls = sum(units for name, units in self.units.items() if name.startswith('eval/'))
+        record = {
+            'iteration': iteration,
+            'wall_time': wall,
+            'env_steps': env_steps,
+            'env_steps_per_sec': env_steps / wall,
+            'eval_calls': eval_calls,
+            'eval_calls_per_sec': eval_calls / wall,
+            'phases': {name: {'seconds': self.seconds[name], 'calls': self.calls[name], 'units': self.units[name]}
+                       for name in sorted(self.seconds)},
+            **metrics,
+        }
+        with open(self.log_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        return record
+
+
+PROFILER = PhaseProfiler()
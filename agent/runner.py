@@ -1,20 +1,21 @@
+import numpy as np
 import torch
-from collections import defaultdict
+from .buffer import MAX_EPISODE_STEPS, RolloutBuffer
+from .profiling import PROFILER
+
+_CARD_BITS = torch.arange(52)
+
+
+def mask_to_tensor(mask, device='cpu'):
+    """Expand a 52-bit card bitmask into a (52,) float tensor of 0/1."""
+    return ((torch.tensor(mask) >> _CARD_BITS) & 1).to(device=device, dtype=torch.float32)
 
 
 def encode_observation(obs_dict):
     """Convert env observation into a (157,) tensor."""
-    deck_mask = torch.zeros(52)
-    hand_mask = torch.zeros(52)
-    opponent_mask = torch.zeros(52)
-
-    for card in obs_dict['player_hand']:
-        hand_mask[card] = 1.0
-    for card in obs_dict['opponent_cards']:
-        opponent_mask[card] = 1.0
-    for card in range(52):
-        if card not in obs_dict['player_hand'] and card not in obs_dict['opponent_cards']:
-            deck_mask[card] = 1.0
+    deck_mask = mask_to_tensor(obs_dict['deck_mask'])
+    hand_mask = mask_to_tensor(obs_dict['hand_mask'])
+    opponent_mask = mask_to_tensor(obs_dict['opponent_mask'])
 
     round_one_hot = torch.zeros(5)
     if 1 <= obs_dict['round'] <= 5:
@@ -22,47 +23,131 @@ def encode_observation(obs_dict):
     return torch.cat([deck_mask, hand_mask, opponent_mask, round_one_hot], dim=0)
 
 
-def collect_rollouts(env_class, policy_net, value_net, num_episodes=10, device='cpu'):
-    """Run episodes and collect rollout data for PPO."""
-    buffer = defaultdict(list)
+def encode_observations(obs_dict, device='cpu'):
+    """Convert a vectorized env observation into an (N, 161) tensor."""
+    masks = np.concatenate([obs_dict['deck_mask'], obs_dict['hand_mask'], obs_dict['opponent_mask']], axis=1)
+    round_one_hot = np.zeros((len(masks), 5), dtype=np.float32)
+    rounds = obs_dict['round']
+    valid = (rounds >= 1) & (rounds <= 5)
+    round_one_hot[valid, rounds[valid] - 1] = 1.0
+    obs = np.concatenate([masks.astype(np.float32), round_one_hot], axis=1)
+    return torch.from_numpy(obs).to(device)
+
+
+def policy_and_value(policy_net, value_net, obs):
+    """(logits, value) from separate networks, or from one actor-critic when value_net is None."""
+    if value_net is None:
+        return policy_net(obs)
+    return policy_net(obs), value_net(obs)
 
-    for _ in range(num_episodes):
-        env = env_class()
-        obs_dict = env.reset()
-        done = False
 
-        while not done:
-            obs_tensor = encode_observation(obs_dict).to(device)
-            logits = policy_net(obs_tensor)
-            value = value_net(obs_tensor)
+def collect_rollouts(env_class, policy_net, value_net, num_episodes=10, device='cpu', buffer=None):
+    """Run episodes and collect rollout data for PPO.
 
-            probs = torch.sigmoid(logits)
-            for c in range(52):
-                if c not in env.deck:
-                    probs[c] = 0.0
+    Steps are written into buffer (a fresh RolloutBuffer sized for
+    num_episodes by default), which is returned.
+    """
+    if buffer is None:
+        buffer = RolloutBuffer.for_episodes(num_episodes, device=device)
 
-            action_mask = (torch.rand(52, device=device) < probs).float()
-            if action_mask.sum() == 0:
-                action_mask[torch.argmax(probs)] = 1.0
+    with torch.no_grad():
+        for _ in range(num_episodes):
+            env = env_class()
+            obs_dict = env.reset()
+            done = False
 
-            log_prob = (
-                    action_mask * torch.log(probs + 1e-8) +
-                    (1 - action_mask) * torch.log(1 - probs + 1e-8)
-            ).sum()
+            while not done:
+                obs_tensor = encode_observation(obs_dict).to(device)
+                with PROFILER.phase('forward'):
+                    logits, value = policy_and_value(policy_net, value_net, obs_tensor)
 
-            action_subset = [i for i in range(52) if action_mask[i] == 1.0]
-            obs_dict_next, reward, done, _ = env.step(action_subset)
+                with PROFILER.phase('sampling'):
+                    probs = torch.sigmoid(logits) * mask_to_tensor(env.deck_mask, device)
 
-            buffer['obs'].append(obs_tensor.detach())
-            buffer['actions'].append(action_mask.detach())
-            buffer['log_probs'].append(log_prob.detach())
-            buffer['rewards'].append(torch.tensor([reward], dtype=torch.float32))
-            buffer['values'].append(value.detach())
-            buffer['dones'].append(torch.tensor([done], dtype=torch.float32))
+                    action_mask = (torch.rand(52, device=device) < probs).float()
+                    if action_mask.sum() == 0:
+                        action_mask[torch.argmax(probs)] = 1.0
+
+                    log_prob = (
+                            action_mask * torch.log(probs + 1e-8) +
+                            (1 - action_mask) * torch.log(1 - probs + 1e-8)
+                    ).sum()
+
+                    action_subset = [i for i in range(52) if action_mask[i] == 1.0]
+                obs_dict, reward, done, _ = env.step(action_subset)
+
+                buffer.add(obs_tensor, action_mask, log_prob, reward, value, done)
+
+    return buffer
 
-            obs_dict = obs_dict_next
 
-    for key in buffer:
-        buffer[key] = torch.stack(buffer[key])
+def collect_rollouts_batched(env_class, policy_net, value_net, num_episodes=10, num_envs=64, device='cpu',
+                             buffer=None, seed=None):
+    """Run episodes on num_envs games at once and collect rollout data for PPO.
+
+    env_class(num_envs, seed=seed) must build a vectorized env such as
+    VecOnePlayerPokerEnv; by default the seed is drawn from numpy's global RNG,
+    so np.random.seed makes collection reproducible. Each step is one forward pass per network over all games. Steps are staged
+    per game and each finished episode is written to buffer as one contiguous
+    block, so the layout matches collect_rollouts.
+    """
+    if buffer is None:
+        buffer = RolloutBuffer.for_episodes(num_episodes, device=device)
+    if seed is None:
+        seed = np.random.randint(2 ** 32, dtype=np.int64)
+    env = env_class(num_envs, seed=int(seed))
+    obs_dict = env.get_observation()
+    envs = torch.arange(num_envs, device=device)
+    staged = RolloutBuffer(num_envs * MAX_EPISODE_STEPS, device=device)
+    staged_rows = {key: getattr(staged, key).view(num_envs, MAX_EPISODE_STEPS, *getattr(staged, key).shape[1:])
+                   for key in staged.fields}
+    length = np.zeros(num_envs, dtype=np.int64)
+
+    # Episode ids in start order; games started past num_episodes keep stepping but are dropped
+    episode = np.arange(num_envs)
+    started = num_envs
+    finished = 0
+
+    with torch.no_grad():
+        while finished < num_episodes:
+            obs_tensor = encode_observations(obs_dict, device)
+            with PROFILER.phase('forward', num_envs):
+                logits, value = policy_and_value(policy_net, value_net, obs_tensor)
+
+            with PROFILER.phase('sampling', num_envs):
+                legal = torch.from_numpy(env.deck_mask).to(device)
+                probs = torch.sigmoid(logits) * legal
+
+                action_mask = (torch.rand(probs.shape, device=device) < probs).float()
+                empty = action_mask.sum(dim=1) == 0
+                action_mask[empty, torch.argmax(probs[empty], dim=1)] = 1.0
+
+                log_prob = (
+                        action_mask * torch.log(probs + 1e-8) +
+                        (1 - action_mask) * torch.log(1 - probs + 1e-8)
+                ).sum(dim=1)
+
+            obs_dict, reward, done, _ = env.step(action_mask.bool().cpu().numpy())
+
+            step = torch.from_numpy(length).to(device)
+            for key, rows in zip(staged.fields, (obs_tensor, action_mask, log_prob,
+                                                 torch.from_numpy(reward).unsqueeze(1),
+                                                 value, torch.from_numpy(done).unsqueeze(1))):
+                staged_rows[key][envs, step] = rows.to(staged_rows[key].dtype)
+            length += 1
+
+            # Copy the finished episodes that are kept out of staging in one gather per field
+            kept = np.flatnonzero(done & (episode < num_episodes))
+            if len(kept):
+                lengths = length[kept]
+                offsets = np.repeat(kept * MAX_EPISODE_STEPS - np.cumsum(lengths) + lengths, lengths)
+                rows = torch.from_numpy(offsets + np.arange(lengths.sum())).to(device)
+                buffer.add_episodes(lengths, *(getattr(staged, key)[rows] for key in staged.fields))
+                finished += len(kept)
+
+            restarted = np.flatnonzero(done)
+            episode[restarted] = started + np.arange(len(restarted))
+            started += len(restarted)
+            length[restarted] = 0
 
     return buffer
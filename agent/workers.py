@@ -0,0 +1,130 @@
+import copy
+import math
+import random
+import traceback
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+from .buffer import RolloutBuffer
+from .runner import collect_rollouts
+
+
+def _worker_seed(seed, iteration, worker_id):
+    return int(np.random.SeedSequence([seed, iteration, worker_id]).generate_state(1)[0])
+
+
+def _seed_all(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def _worker_loop(worker_id, env_class, collect, shared_policy, shared_value, buffer, commands, results):
+    """Collect episodes on request with a private copy of the shared networks.
+
+    The rollout is written straight into the worker's shared RolloutBuffer;
+    only its length goes back through the results queue.
+    """
+    torch.set_num_threads(1)
+    policy_net = copy.deepcopy(shared_policy)
+    value_net = copy.deepcopy(shared_value)
+
+    while True:
+        command = commands.get()
+        if command is None:
+            return
+        seed, num_episodes = command
+        try:
+            policy_net.load_state_dict(shared_policy.state_dict())
+            if value_net is not None:
+                value_net.load_state_dict(shared_value.state_dict())
+            _seed_all(seed)
+            buffer.reset()
+            collect(env_class, policy_net, value_net, num_episodes=num_episodes, buffer=buffer)
+            results.put((worker_id, buffer.size, None))
+        except Exception:
+            results.put((worker_id, 0, traceback.format_exc()))
+
+
+class RolloutWorkerPool:
+    """Collect rollouts in num_workers processes.
+
+    Each worker keeps a private CPU copy of the networks, refreshed once per
+    collect() from shared-memory copies, and writes its trajectories into its
+    own preallocated shared-memory buffer. The per-worker buffers are
+    concatenated in worker order, so a fixed seed gives the same rollout
+    regardless of scheduling. Workers reseed random, numpy and torch from
+    (seed, iteration, worker) before each collection.
+    """
+
+    def __init__(self, env_class, policy_net, value_net, num_workers=4, num_episodes=150,
+                 seed=None, collect=collect_rollouts):
+        self.num_workers = num_workers
+        self.num_episodes = num_episodes
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2 ** 32)
+        self.iteration = 0
+
+        self.shared_policy = copy.deepcopy(policy_net).cpu().share_memory()
+        self.shared_value = copy.deepcopy(value_net).cpu().share_memory() if value_net is not None else None
+
+        obs_dim = self.shared_policy.fc1.in_features
+        self.buffers = [
+            RolloutBuffer.for_episodes(math.ceil(num_episodes / num_workers), obs_dim=obs_dim).share_memory_()
+            for _ in range(num_workers)
+        ]
+
+        self.results = mp.Queue()
+        self.commands = [mp.Queue() for _ in range(num_workers)]
+        self.workers = [
+            mp.Process(target=_worker_loop, daemon=True,
+                       args=(i, env_class, collect, self.shared_policy, self.shared_value,
+                             self.buffers[i], self.commands[i], self.results))
+            for i in range(num_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def episode_split(self, num_episodes):
+        """Episodes per worker, the remainder going to the first workers."""
+        base, extra = divmod(num_episodes, self.num_workers)
+        return [base + (i < extra) for i in range(self.num_workers)]
+
+    def collect(self, policy_net, value_net, device='cpu'):
+        """Sync the workers to the given networks and collect num_episodes episodes."""
+        # load_state_dict copies in place, so the parameters stay in shared memory
+        self.shared_policy.load_state_dict(policy_net.state_dict())
+        if value_net is not None:
+            self.shared_value.load_state_dict(value_net.state_dict())
+
+        split = self.episode_split(self.num_episodes)
+        for i, episodes in enumerate(split):
+            if episodes:
+                self.commands[i].put((_worker_seed(self.seed, self.iteration, i), episodes))
+        self.iteration += 1
+
+        lengths = [0] * self.num_workers
+        errors = []
+        for _ in range(sum(1 for episodes in split if episodes)):
+            worker_id, length, error = self.results.get()
+            lengths[worker_id] = length
+            if error is not None:
+                errors.append(f"worker {worker_id}:\n{error}")
+        if errors:
+            raise RuntimeError("rollout worker failed\n" + "\n".join(errors))
+
+        return {
+            key: torch.cat([getattr(buffer, key)[:length] for buffer, length in zip(self.buffers, lengths)]).to(device)
+            for key in RolloutBuffer.fields
+        }
+
+    def close(self):
+        for commands in self.commands:
+            commands.put(None)
+        for worker in self.workers:
+            worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,135 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+
+
+class Overloaded(Exception):
+    """More requests are in flight than the pool accepts."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"server busy, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+def check_move(env, selected_cards):
+    """Raise ValueError unless selected_cards is a legal move in env's game."""
+    if env.done:
+        raise ValueError("Game is over, reset to play again")
+    if not isinstance(selected_cards, list) or not all(
+            type(card) is int and 0 <= card < 52 for card in selected_cards):
+        raise ValueError("Cards must be IDs from 0 to 51")
+    deck_mask = env.deck_mask
+    taken = [card for card in selected_cards if not deck_mask >> card & 1]
+    if taken:
+        raise ValueError(f"Cards no longer in the deck: {taken}")
+
+
+def play_step(env, selected_cards):
+    """Play one move and build the /step response; returns (env, response).
+
+    Runs in a worker process on a copy of the session's env, so the updated
+    env is sent back with the result. Illegal moves raise ValueError.
+    """
+    check_move(env, selected_cards)
+    obs, reward, done, _ = env.step(selected_cards)
+
+    if done:
+        player_best = env.best_5_cards(env.player_hand)
+        player_rank = env.hand_rank_name(player_best)
+
+        best_score, best_opponent_hand = env.best_opponent_hand_rank()
+        opponent_best = best_opponent_hand
+        opponent_rank = env.hand_rank_name(best_opponent_hand)
+    else:
+        player_best = []
+        player_rank = ""
+        opponent_best = []
+        opponent_rank = ""
+
+    return env, {
+        "observation": {
+            "player_hand": env.player_hand,
+            "opponent_cards": env.opponent_cards,
+            "player_best_hand": player_best,
+            "opponent_best_hand": opponent_best,
+            "player_hand_rank": player_rank,
+            "opponent_hand_rank": opponent_rank
+        },
+        "reward": reward,
+        "done": done
+    }
+
+
+class EvalPool:
+    """Run CPU-heavy game steps in worker processes, with admission control.
+
+    At most max_pending requests may be admitted at once, counting both those
+    queued for a worker and those running; admit() raises Overloaded beyond
+    that, so a burst is turned away instead of piling up. With max_workers=0
+    steps run in the event loop's default thread pool instead (no extra
+    processes, but the GIL serializes them). If a worker dies (say, killed
+    for running out of memory) the pool is replaced, and the requests it
+    broke are answered with Overloaded so clients retry.
+    """
+
+    def __init__(self, max_workers=2, max_pending=64, retry_after=1):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.pending = 0
+        self.rejected = 0
+        self.completed = 0
+        self.restarts = 0
+        self._executor = None
+
+    @property
+    def executor(self):
+        if self._executor is None and self.max_workers > 0:
+            self._executor = ProcessPoolExecutor(self.max_workers)
+        return self._executor
+
+    def start(self):
+        """Start the workers now rather than on the first request."""
+        if self.executor is not None:
+            self.executor.submit(int).result()
+
+    @contextmanager
+    def admit(self):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise Overloaded(self.retry_after)
+        self.pending += 1
+        try:
+            yield
+        finally:
+            self.pending -= 1
+
+    async def run(self, fn, *args):
+        executor = self.executor
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # Every request in flight on a broken pool fails; only the first replaces it
+            if self._executor is executor:
+                self._executor = None
+                self.restarts += 1
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise Overloaded(self.retry_after)
+        self.completed += 1
+        return result
+
+    def stats(self):
+        return {
+            'workers': self.max_workers,
+            'pending': self.pending,
+            'max_pending': self.max_pending,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'restarts': self.restarts,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
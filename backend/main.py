@@ -1,9 +1,35 @@
-from fastapi import FastAPI, Request
+import asyncio
+import os
+from contextlib import asynccontextmanager
+import time
+from fastapi import Cookie, FastAPI, Header, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from poker_env.poker_env import OnePlayerPokerEnv
+from eval_pool import EvalPool, Overloaded, check_move, play_step
+from metrics import LatencyStats
+from policy_server import PolicyServer
+from sessions import SessionStore
 
-app = FastAPI()
+
+async def evict_idle_sessions():
+    # Otherwise idle games are only dropped when a new one is created or they are asked for again
+    while True:
+        await asyncio.sleep(sessions.ttl / 10)
+        sessions.evict_expired()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    eval_pool.start()
+    evictor = asyncio.create_task(evict_idle_sessions())
+    yield
+    evictor.cancel()
+    eval_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow frontend to call backend
 app.add_middleware(
@@ -12,11 +38,70 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
-# Global poker game environment
-env = OnePlayerPokerEnv()
-env.reset()
+# Steps run in worker processes; beyond POKER_MAX_PENDING requests in flight the server answers 503
+eval_pool = EvalPool(
+    max_workers=int(os.environ.get("POKER_WORKERS", 2)),
+    max_pending=int(os.environ.get("POKER_MAX_PENDING", 64)),
+    retry_after=int(os.environ.get("POKER_RETRY_AFTER", 1)),
+)
+latency = LatencyStats()
+app.middleware("http")(latency.middleware())
+
+
+@app.exception_handler(Overloaded)
+async def overloaded(request: Request, exc: Overloaded):
+    return JSONResponse(status_code=503, content={"detail": str(exc)},
+                        headers={"Retry-After": str(exc.retry_after)})
+
+
+# Suggested moves from a trained policy; /suggest is off when torch, the agent package
+# (run with the repo root on PYTHONPATH) or the checkpoint is missing
+policy_server = PolicyServer.load(
+    os.environ.get("POKER_POLICY_PATH",
+                   os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "scripts", "checkpoints-m1", "policy.pth")),
+    max_batch_size=int(os.environ.get("POKER_SUGGEST_BATCH", 32)),
+    max_wait_ms=float(os.environ.get("POKER_SUGGEST_WAIT_MS", 5)),
+)
+
+# One game per visitor; idle games expire and the oldest are dropped at the cap
+SESSION_COOKIE = "session_id"
+sessions = SessionStore(
+    OnePlayerPokerEnv,
+    max_sessions=int(os.environ.get("POKER_MAX_SESSIONS", 1000)),
+    ttl=float(os.environ.get("POKER_SESSION_TTL", 1800)),
+)
+
+
+def session_id_from(header, cookie):
+    # The header works across origins where third-party cookies are blocked
+    return header or cookie
+
+
+async def play_move(session, selected_cards):
+    """Play a move in an eval worker.
+
+    Raises ValueError for an illegal move (checked here, before it takes up a
+    worker) and Overloaded when too many moves are queued.
+    """
+    with eval_pool.admit():
+        async with session.lock:
+            check_move(session.env, selected_cards)
+            session.env, result = await eval_pool.run(play_step, session.env, selected_cards)
+    return result
+
+
+async def reset_session(session_id):
+    """Restart the caller's game, or start one if the session is unknown or expired."""
+    session = sessions.get(session_id)
+    if session is None:
+        return sessions.create()
+    async with session.lock:
+        session.env.reset()
+    return session
 
 
 # Define request body structure
@@ -25,37 +110,120 @@ class StepRequest(BaseModel):
 
 
 @app.post("/step")
-def step(req: StepRequest):
-    obs, reward, done, _ = env.step(req.selected_cards)
-
-    if done:
-        player_best = env.best_5_cards(env.player_hand)
-        player_rank = env.hand_rank_name(player_best)
-
-        best_score, best_opponent_hand = env.best_opponent_hand_rank()
-        opponent_best = best_opponent_hand
-        opponent_rank = env.hand_rank_name(best_opponent_hand)
-    else:
-        player_best = []
-        player_rank = ""
-        opponent_best = []
-        opponent_rank = ""
+async def step(req: StepRequest,
+               x_session_id: str | None = Header(default=None),
+               session_id: str | None = Cookie(default=None)):
+    session = sessions.get(session_id_from(x_session_id, session_id))
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired session, call /reset")
 
-    return {
-        "observation": {
-            "player_hand": env.player_hand,
-            "opponent_cards": env.opponent_cards,
-            "player_best_hand": player_best,
-            "opponent_best_hand": opponent_best,
-            "player_hand_rank": player_rank,
-            "opponent_hand_rank": opponent_rank
-        },
-        "reward": reward,
-        "done": done
-    }
+    try:
+        return await play_move(session, req.selected_cards)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/suggest")
+async def suggest(x_session_id: str | None = Header(default=None),
+                  session_id: str | None = Cookie(default=None)):
+    if policy_server is None:
+        raise HTTPException(status_code=503, detail="No policy loaded")
+    session = sessions.get(session_id_from(x_session_id, session_id))
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired session, call /reset")
+
+    # Wait for a move in flight, so the suggestion is for the current position
+    async with session.lock:
+        if session.env.done:
+            raise HTTPException(status_code=400, detail="Game is over, call /reset")
+        obs = session.env.get_observation()
+    cards, probabilities = await policy_server.suggest(obs)
+    return {"selected_cards": cards, "probabilities": probabilities}
 
 
 @app.get("/reset")
-def reset():
-    env.reset()
-    return {"message": "game reset"}
+async def reset(response: Response,
+                x_session_id: str | None = Header(default=None),
+                session_id: str | None = Cookie(default=None)):
+    session = await reset_session(session_id_from(x_session_id, session_id))
+    response.set_cookie(SESSION_COOKIE, session.id, max_age=int(sessions.ttl), httponly=True, samesite="lax")
+    return {"message": "game reset", "session_id": session.id}
+
+
+@app.websocket("/ws")
+async def game_socket(websocket: WebSocket):
+    """One game per connection, without an HTTP request per move.
+
+    The client sends {"type": "step", "cards": [...]} or {"type": "reset"}.
+    The server answers each message with what changed since its last answer:
+    {"type": "reset", "session_id"} for a new game (also sent on connect),
+    {"type": "step", "card", "discarded", "reward", "done"} after a move,
+    where card is the card drawn into the hand (null if the deck ran out) and
+    discarded the cards passed to the opponent, plus "result" (best hands and
+    ranks) once the game is over; or {"type": "error", "detail"}, with
+    "retry_after" when the server is busy and "expired" when the game has
+    expired and needs a reset. session_id also works for /suggest.
+    """
+    await websocket.accept()
+    session = sessions.create()
+    await websocket.send_json({"type": "reset", "session_id": session.id})
+    hand_size = discarded_size = 0
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                message = None
+            start = time.perf_counter()
+            kind = message.get("type") if isinstance(message, dict) else None
+            if kind == "reset":
+                session = await reset_session(session.id)
+                hand_size = discarded_size = 0
+                await websocket.send_json({"type": "reset", "session_id": session.id})
+            elif kind == "step":
+                if sessions.get(session.id) is None:
+                    await websocket.send_json({"type": "error", "detail": "Session expired, send reset", "expired": True})
+                    continue
+                try:
+                    result = await play_move(session, message.get("cards", []))
+                except Overloaded as e:
+                    await websocket.send_json({"type": "error", "detail": str(e), "retry_after": e.retry_after})
+                    continue
+                except ValueError as e:
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                    continue
+
+                observation = result["observation"]
+                hand, discarded = observation["player_hand"], observation["opponent_cards"]
+                delta = {
+                    "type": "step",
+                    "card": hand[hand_size] if len(hand) > hand_size else None,
+                    "discarded": discarded[discarded_size:],
+                    "reward": result["reward"],
+                    "done": result["done"],
+                }
+                hand_size, discarded_size = len(hand), len(discarded)
+                if result["done"]:
+                    delta["result"] = {key: observation[key] for key in
+                                       ("player_best_hand", "opponent_best_hand",
+                                        "player_hand_rank", "opponent_hand_rank")}
+                await websocket.send_json(delta)
+            else:
+                await websocket.send_json({"type": "error", "detail": f"Unknown message type {kind!r}"})
+                continue
+            latency.record(f"WS {kind}", time.perf_counter() - start)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # The game ends with its connection
+        sessions.remove(session.id)
+
+
+@app.get("/metrics")
+async def metrics():
+    return {
+        "latency": latency.summary(),
+        "eval_pool": eval_pool.stats(),
+        "sessions": sessions.stats(),
+        "suggest": policy_server.stats() if policy_server is not None else None,
+    }
@@ -0,0 +1,46 @@
+import time
+from collections import defaultdict, deque
+import numpy as np
+
+
+class LatencyStats:
+    """Recent request latencies per route, summarized as percentiles.
+
+    Keeps the last `window` samples of each route, so memory stays bounded and
+    the percentiles follow the current load.
+    """
+
+    def __init__(self, window=10000):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._counts = defaultdict(int)
+
+    def record(self, route, seconds):
+        self._samples[route].append(seconds)
+        self._counts[route] += 1
+
+    def summary(self):
+        """{route: {count, p50_ms, p95_ms, p99_ms, max_ms}} over each route's window."""
+        summary = {}
+        for route, samples in sorted(self._samples.items()):
+            ms = np.asarray(samples) * 1e3
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            summary[route] = {
+                'count': self._counts[route],
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'max_ms': float(ms.max()),
+            }
+        return summary
+
+    def middleware(self):
+        """An HTTP middleware recording each request's latency under its route."""
+        async def record_latency(request, call_next):
+            start = time.perf_counter()
+            response = await call_next(request)
+            # Key by the matched route, so unknown paths can't grow the table
+            route = request.scope.get("route")
+            self.record(f"{request.method} {route.path if route else 'unmatched'}", time.perf_counter() - start)
+            return response
+        return record_latency
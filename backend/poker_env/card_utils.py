@@ -32,3 +32,11 @@ def id_to_numeric(card_id):
     rank = (card_id % 13) + 2
     suit = card_id // 13
     return rank, suit
+
+
+def cards_to_mask(card_ids):
+    """Return a 52-bit int with bit `card_id` set for each card."""
+    mask = 0
+    for c in card_ids:
+        mask |= 1 << c
+    return mask
@@ -0,0 +1,88 @@
+"""Shared, size-bounded LRU cache for hand evaluations.
+
+Each process holds its own EVAL_CACHE; a snapshot file can carry a warm cache
+from one run (or one worker) into the next. Set POKER_EVAL_CACHE=0 to turn
+caching off and POKER_EVAL_CACHE_SIZE to change the number of entries kept.
+"""
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+
+class EvalCache:
+    """LRU mapping with hit, miss and eviction counters.
+
+    Safe to share between threads (the server can play moves on a thread
+    pool): every read or update of the entries holds one lock.
+    """
+
+    def __init__(self, maxsize=1 << 18, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss (or when disabled)."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path):
+        """Write the entries (least recently used first) to path, atomically."""
+        tmp_path = f"{path}.tmp"
+        with self._lock:
+            items = list(self._data.items())
+        with open(tmp_path, "wb") as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        """Warm-start from a snapshot written by save; a missing file is ignored."""
+        if not self.enabled or not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            for key, value in pickle.load(f):
+                self.put(key, value)
+
+
+EVAL_CACHE = EvalCache(
+    maxsize=int(os.environ.get("POKER_EVAL_CACHE_SIZE", 1 << 18)),
+    enabled=os.environ.get("POKER_EVAL_CACHE", "1") != "0",
+)
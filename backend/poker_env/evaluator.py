@@ -0,0 +1,489 @@
+import itertools
+from bisect import bisect_left
+from functools import lru_cache
+from math import comb
+import numpy as np
+from . import poker_data
+from .eval_cache import EVAL_CACHE
+
+# Cactus Kev encoding setup
+_SUITS = [1 << (i + 12) for i in range(4)]
+_RANKS = [(1 << (i + 16)) | (i << 8) for i in range(13)]
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+_DECK = [_RANKS[r] | _SUITS[s] | _PRIMES[r] for r, s in itertools.product(range(13), range(4))]
+
+# Cactus Kev integer for every card ID (suit * 13 + rank index)
+CARD_INTS = [_DECK[(cid % 13) * 4 + cid // 13] for cid in range(52)]
+
+_CARD_INTS_NP = np.array(CARD_INTS, dtype=np.uint64)
+
+# Lookup tables, bound by _load_tables on the first evaluation
+FLUSHES = UNIQUE_5 = HASH_ADJUST = HASH_VALUES = None
+
+
+def _load_tables():
+    global FLUSHES, UNIQUE_5, HASH_ADJUST, HASH_VALUES
+    FLUSHES, UNIQUE_5, HASH_ADJUST, HASH_VALUES = (poker_data.load_array(name) for name in poker_data.TABLE_NAMES)
+
+
+def _hash_lookup(p):
+    """Perfect-hash lookup for non-flush, non-unique hands from the prime product."""
+    x = p + 0xe91aaa35
+    x ^= x >> 16
+    x += x << 8
+    x &= 0xffffffff
+    x ^= x >> 4
+    b = (x >> 8) & 0x1ff
+    a = (x + (x << 2)) >> 19
+    r = (a ^ HASH_ADJUST[b]) & 0x1fff
+    return HASH_VALUES[r]
+
+
+def score_ids(c1, c2, c3, c4, c5):
+    """Return cactus kev score (1 best, 7462 worst) from 5 card IDs."""
+    if FLUSHES is None:
+        _load_tables()
+    c1 = CARD_INTS[c1]
+    c2 = CARD_INTS[c2]
+    c3 = CARD_INTS[c3]
+    c4 = CARD_INTS[c4]
+    c5 = CARD_INTS[c5]
+
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if 0xf000 & c1 & c2 & c3 & c4 & c5:
+        return FLUSHES[q]
+    s = UNIQUE_5[q]
+    if s:
+        return s
+    return _hash_lookup((c1 & 0xff) * (c2 & 0xff) * (c3 & 0xff) * (c4 & 0xff) * (c5 & 0xff))
+
+
+def _hash_lookup_batch(p):
+    """Vectorized _hash_lookup over a uint64 array of prime products."""
+    x = p + 0xe91aaa35
+    x ^= x >> 16
+    x += x << 8
+    x &= 0xffffffff
+    x ^= x >> 4
+    b = (x >> 8) & 0x1ff
+    a = (x + (x << 2)) >> 19
+    r = (a ^ poker_data.load_numpy("HASH_ADJUST")[b]) & 0x1fff
+    return poker_data.load_numpy("HASH_VALUES")[r]
+
+
+def score_hands_batch(ids):
+    """Return cactus kev scores (int32 [N]) for an [N, 5] array of card IDs."""
+    c = _CARD_INTS_NP[np.asarray(ids)]
+    q = np.bitwise_or.reduce(c, axis=1) >> 16
+    flush = (np.bitwise_and.reduce(c, axis=1) & 0xf000) != 0
+
+    flushes = poker_data.load_numpy("FLUSHES")
+    unique_5 = poker_data.load_numpy("UNIQUE_5")
+    scores = np.where(flush, flushes[q], unique_5[q]).astype(np.int32)
+    rest = scores == 0
+    if rest.any():
+        p = np.prod(c[rest] & 0xff, axis=1)
+        scores[rest] = _hash_lookup_batch(p)
+    return scores
+
+
+@lru_cache(maxsize=None)
+def _combo_index(n, k=5):
+    """[C(n, k), k] index array of every k-card combination of n positions."""
+    return np.array(list(itertools.combinations(range(n), k)), dtype=np.intp).reshape(-1, k)
+
+
+def best_hand_batch(card_ids):
+    """Return (score, hand) of the best 5-card combination, scoring all combos in one batch."""
+    if len(card_ids) < 5:
+        return None, []
+    if len(card_ids) == 5:
+        return score_ids(*card_ids), list(card_ids)
+    combos = np.asarray(card_ids)[_combo_index(len(card_ids))]
+    scores = score_hands_batch(combos)
+    i = int(np.argmin(scores))
+    return int(scores[i]), combos[i].tolist()
+
+
+# Rank indices of the ten straights, best first (A-high down to the 5-high wheel)
+_STRAIGHTS = [(0x1f << (high - 4), list(range(high, high - 5, -1))) for high in range(12, 3, -1)]
+_STRAIGHTS.append((0x100f, [3, 2, 1, 0, 12]))
+
+
+def _straight_ranks(rank_mask):
+    """Return the rank indices of the highest straight in a 13-bit rank mask, or None."""
+    for mask, ranks in _STRAIGHTS:
+        if rank_mask & mask == mask:
+            return ranks
+    return None
+
+
+def best_hand(card_ids):
+    """Return (score, hand) of the best 5-card hand in any number of card IDs.
+
+    Works from per-suit and per-rank groupings instead of scoring every
+    5-card combination, so cost grows linearly with the number of cards.
+    """
+    if len(card_ids) < 5:
+        return None, []
+    if len(card_ids) == 5:
+        return score_ids(*card_ids), list(card_ids)
+
+    by_rank = [[] for _ in range(13)]
+    by_suit = [[] for _ in range(4)]
+    for c in card_ids:
+        by_rank[c % 13].append(c)
+        by_suit[c // 13].append(c)
+
+    # Straight flushes and flushes
+    flush = None
+    for suited in by_suit:
+        if len(suited) < 5:
+            continue
+        rank_mask = 0
+        for c in suited:
+            rank_mask |= 1 << (c % 13)
+        ranks = _straight_ranks(rank_mask)
+        if ranks is not None:
+            base = suited[0] - suited[0] % 13
+            hand = [base + r for r in ranks]
+        else:
+            hand = sorted(suited, reverse=True)[:5]
+        score = score_ids(*hand)
+        if flush is None or score < flush[0]:
+            flush = (score, hand)
+    if flush is not None and flush[0] <= 10:
+        return flush
+
+    groups = sorted((r for r in range(13) if by_rank[r]),
+                    key=lambda r: (len(by_rank[r]), r), reverse=True)
+    top = len(by_rank[groups[0]])
+    second = len(by_rank[groups[1]]) if len(groups) > 1 else 0
+
+    if top == 4:
+        made = by_rank[groups[0]]
+    elif top == 3 and second >= 2:
+        pair = max(r for r in groups[1:] if len(by_rank[r]) >= 2)
+        hand = by_rank[groups[0]] + by_rank[pair][:2]
+        return score_ids(*hand), hand
+    elif flush is not None:
+        return flush
+    else:
+        ranks = _straight_ranks(sum(1 << r for r in groups))
+        if ranks is not None:
+            hand = [by_rank[r][0] for r in ranks]
+            return score_ids(*hand), hand
+        if top == 3:
+            made = by_rank[groups[0]]
+        elif top == 2 and second == 2:
+            made = by_rank[groups[0]] + by_rank[groups[1]]
+        elif top == 2:
+            made = by_rank[groups[0]]
+        else:
+            made = []
+
+    kickers = sorted((c for c in card_ids if c not in made), key=lambda c: c % 13, reverse=True)
+    hand = made + kickers[:5 - len(made)]
+    return score_ids(*hand), hand
+
+
+HAND_NAMES = [
+    "High Card", "One Pair", "Two Pair", "Three of a Kind",
+    "Straight", "Flush", "Full House", "Four of a Kind", "Straight Flush"
+]
+
+# Worst score of each category from Straight Flush (8) down to One Pair (1);
+# anything above the last bound is High Card (0)
+_CATEGORY_BOUNDS = [10, 166, 322, 1599, 1609, 2467, 3325, 6185]
+_CATEGORY_BOUNDS_NP = np.array(_CATEGORY_BOUNDS, dtype=np.int32)
+
+
+def hand_category(score):
+    """Category (0 High Card ... 8 Straight Flush) of a cactus kev score."""
+    return 8 - bisect_left(_CATEGORY_BOUNDS, score)
+
+
+def hand_categories(scores):
+    """Vectorized hand_category over an array of scores."""
+    return 8 - np.searchsorted(_CATEGORY_BOUNDS_NP, scores, side="left")
+
+
+def _tiebreakers(ranks, category):
+    """Tiebreakers for 5 rank indices: ranks grouped by (count, rank) descending as 2-14 values."""
+    if category in (4, 8):
+        return [5 if sorted(ranks) == [0, 1, 2, 3, 12] else max(ranks) + 2]
+    groups = sorted(set(ranks), key=lambda r: (ranks.count(r), r), reverse=True)
+    return [r + 2 for r in groups]
+
+
+@lru_cache(maxsize=None)
+def _tiebreak_table():
+    """[7463, 5] array of tiebreakers per score (zero padded), built from one hand per score."""
+    table = np.zeros((7463, 5), dtype=np.int8)
+    for ranks in itertools.combinations_with_replacement(range(13), 5):
+        if max(ranks.count(r) for r in ranks) > 4:
+            continue
+        # Repeated ranks take successive suits; distinct ranks get a flush and an off-suit version
+        seen = [0] * 13
+        hand = []
+        for r in ranks:
+            hand.append(seen[r] * 13 + r)
+            seen[r] += 1
+        hands = [hand]
+        if len(set(ranks)) == 5:
+            hands.append(hand[:4] + [hand[4] + 13])
+        for h in hands:
+            score = score_ids(*h)
+            tb = _tiebreakers(list(ranks), hand_category(score))
+            table[score, :len(tb)] = tb
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _tiebreak_lists():
+    """Python-list copy of _tiebreak_table for scalar lookups."""
+    return [[r for r in row if r] for row in _tiebreak_table().tolist()]
+
+
+def score_tiebreak(score):
+    """Return (category, tiebreakers) for a cactus kev score, matching evaluate_hand."""
+    return hand_category(score), _tiebreak_lists()[score].copy()
+
+
+def score_tiebreaks_batch(scores):
+    """Return (categories [N], tiebreakers [N, 5] zero padded) for an array of scores."""
+    scores = np.asarray(scores)
+    return hand_categories(scores), _tiebreak_table()[scores]
+
+
+# C(n, k) for n = cards of a rank left in the deck (0-4), k = cards of that rank drawn (0-5)
+_BINOM_SMALL = np.array([[comb(n, k) for k in range(6)] for n in range(5)], dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def _rank_multisets(size):
+    """Rank counts [P, 13], prime products [P] and rank masks [P] of every multiset of size ranks."""
+    multisets = list(itertools.combinations_with_replacement(range(13), size))
+    counts = np.zeros((len(multisets), 13), dtype=np.int64)
+    primes = np.ones(len(multisets), dtype=np.uint64)
+    masks = np.zeros(len(multisets), dtype=np.uint64)
+    for i, ranks in enumerate(multisets):
+        for r in ranks:
+            counts[i, r] += 1
+            primes[i] *= _PRIMES[r]
+            masks[i] |= 1 << r
+    return counts, primes, masks
+
+
+def expected_score_exact(hand, deck):
+    """Exact mean score of hand completed to 5 cards with every combination from deck.
+
+    Non-flush scores depend only on ranks, so completions are grouped by rank
+    multiset and weighted by how many ways the deck can supply them; flushes
+    are then corrected for separately. The result is memoized on a key that
+    ignores suit labels (see _expected_score), so suit-relabelled positions
+    share one entry in EVAL_CACHE. Returns the worst score (7462) if no completion exists.
+    """
+    if len(hand) >= 5:
+        return float(score_ids(*hand))
+
+    deck_counts = [0] * 13
+    for c in deck:
+        deck_counts[c % 13] += 1
+
+    # Suits that can still make a flush, described by the deck ranks left in them
+    hand_suits = {c // 13 for c in hand}
+    flush_suits = range(4) if not hand else hand_suits if len(hand_suits) == 1 else ()
+    flush_masks = []
+    for s in flush_suits:
+        mask = 0
+        for c in deck:
+            if c // 13 == s:
+                mask |= 1 << (c % 13)
+        flush_masks.append(mask)
+
+    return expected_score_from_counts(tuple(sorted(c % 13 for c in hand)), tuple(deck_counts),
+                                      tuple(sorted(flush_masks)))
+
+
+def expected_score_from_counts(hand_ranks, deck_counts, flush_masks):
+    """Cached exact expected score from the suit-free description built by expected_score_exact.
+
+    hand_ranks is the sorted tuple of hand rank indices, deck_counts the 13 per-rank
+    deck counts and flush_masks the sorted deck rank masks of suits that can still flush.
+    """
+    key = ("expected", hand_ranks, deck_counts, flush_masks)
+    score = EVAL_CACHE.get(key)
+    if score is None:
+        score = _expected_score(hand_ranks, deck_counts, flush_masks)
+        EVAL_CACHE.put(key, score)
+    return score
+
+
+def _expected_score(hand_ranks, deck_counts, flush_masks):
+    need = 5 - len(hand_ranks)
+    total = comb(sum(deck_counts), need)
+    if total == 0:
+        return 7462.0
+
+    hand_counts = np.zeros(13, dtype=np.int64)
+    hand_prime = 1
+    hand_mask = 0
+    for r in hand_ranks:
+        hand_counts[r] += 1
+        hand_prime *= _PRIMES[r]
+        hand_mask |= 1 << r
+
+    # Every completion scored as a non-flush, weighted by its number of suit assignments
+    counts, primes, masks = _rank_multisets(need)
+    weights = np.prod(_BINOM_SMALL[np.array(deck_counts), counts], axis=1)
+    keep = weights > 0
+    weights = weights[keep]
+    q = masks[keep] | hand_mask
+    distinct = (counts[keep] + hand_counts).max(axis=1) == 1
+
+    scores = poker_data.load_numpy("UNIQUE_5")[q].astype(np.int64)
+    if not distinct.all():
+        scores[~distinct] = _hash_lookup_batch(primes[keep][~distinct] * hand_prime)
+    total_score = int((weights * scores).sum())
+
+    # Completions drawn entirely from the hand's suit are flushes instead
+    flushes = poker_data.load_numpy("FLUSHES")
+    unique_5 = poker_data.load_numpy("UNIQUE_5")
+    for mask in flush_masks:
+        ranks = np.array([r for r in range(13) if mask >> r & 1], dtype=np.uint64)
+        if len(ranks) < need:
+            continue
+        q = np.bitwise_or.reduce(np.uint64(1) << ranks[_combo_index(len(ranks), need)], axis=1) | hand_mask
+        total_score += int(flushes[q].astype(np.int64).sum() - unique_5[q].astype(np.int64).sum())
+
+    return total_score / total
+
+
+_PRIMES_NP = np.array(_PRIMES, dtype=np.uint64)
+_RANK_BITS_NP = np.uint64(1) << np.arange(13, dtype=np.uint64)
+
+
+@lru_cache(maxsize=None)
+def _rank_multiset_slots(size):
+    """Sparse form of _rank_multisets: ([P, size] ranks, [P, size] counts).
+
+    Unused slots have count 0, so they contribute C(n, 0) = 1 to weight products.
+    """
+    counts, _, _ = _rank_multisets(size)
+    slot_ranks = np.zeros((len(counts), size), dtype=np.int64)
+    slot_counts = np.zeros((len(counts), size), dtype=np.int64)
+    for i, row in enumerate(counts.tolist()):
+        used = [r for r in range(13) if row[r]]
+        slot_ranks[i, :len(used)] = used
+        slot_counts[i, :len(used)] = [row[r] for r in used]
+    return slot_ranks, slot_counts
+
+
+@lru_cache(maxsize=None)
+def _completion_scores(size):
+    """Non-flush scores of every size-rank hand completed by every (5 - size)-rank multiset.
+
+    Returns ({hand ranks tuple: row}, [H, P] int64 scores), columns ordered as
+    _rank_multisets(5 - size); impossible combinations (a rank five times) score 0.
+    """
+    hand_counts, hand_primes, hand_masks = _rank_multisets(size)
+    counts, primes, masks = _rank_multisets(5 - size)
+    combined = hand_counts[:, None, :] + counts[None]
+    q = hand_masks[:, None] | masks[None]
+    scores = poker_data.load_numpy("UNIQUE_5")[q].astype(np.int64)
+    paired = combined.max(axis=2) > 1
+    scores[paired] = _hash_lookup_batch((hand_primes[:, None] * primes[None])[paired])
+    scores[combined.max(axis=2) > 4] = 0
+    rows = {ranks: i for i, ranks in enumerate(itertools.combinations_with_replacement(range(13), size))}
+    return rows, scores
+
+
+@lru_cache(maxsize=None)
+def _rank_combo_masks(size):
+    """Rank masks of every size-subset of the 13 ranks."""
+    return np.bitwise_or.reduce(_RANK_BITS_NP[_combo_index(13, size)], axis=1)
+
+
+def expected_scores_batch(hands, hand_sizes, deck_masks, chunk_size=128):
+    """Vectorized expected_score_exact for many games at once.
+
+    hands is [E, 5] card IDs of which the first hand_sizes[e] are held,
+    deck_masks is [E, 52] bool. Returns [E] float64, equal to what
+    expected_score_exact gives for each game. Games are looked up in and
+    added to EVAL_CACHE under expected_score_from_counts' suit-free key, so
+    only the misses are computed.
+    """
+    hands = np.asarray(hands, dtype=np.int64)
+    hand_sizes = np.asarray(hand_sizes)
+    deck = np.asarray(deck_masks, dtype=bool).reshape(-1, 4, 13)
+    deck_counts = deck.sum(axis=1, dtype=np.int8)
+    suit_masks = (deck * _RANK_BITS_NP).sum(axis=2, dtype=np.uint64)
+    deck_sizes = deck_counts.sum(axis=1).tolist()
+    flushes = poker_data.load_numpy("FLUSHES").astype(np.int64)
+    unique_5 = poker_data.load_numpy("UNIQUE_5").astype(np.int64)
+
+    out = np.empty(len(hands), dtype=np.float64)
+    pending = np.ones(len(hands), dtype=bool)
+    keys = {}
+    if EVAL_CACHE.enabled:
+        for e, (size, hand, counts, masks) in enumerate(zip(hand_sizes.tolist(), hands.tolist(),
+                                                            deck_counts.tolist(), suit_masks.tolist())):
+            if size >= 5:
+                continue
+            hand = hand[:size]
+            hand_suits = {c // 13 for c in hand}
+            flush_suits = range(4) if not hand else hand_suits if len(hand_suits) == 1 else ()
+            key = ("expected", tuple(sorted(c % 13 for c in hand)), tuple(counts),
+                   tuple(sorted(masks[s] for s in flush_suits)))
+            score = EVAL_CACHE.get(key)
+            if score is None:
+                keys[e] = key
+            else:
+                out[e] = score
+                pending[e] = False
+
+    for size in np.unique(hand_sizes[pending]).tolist():
+        env_ids = np.flatnonzero((hand_sizes == size) & pending)
+        need = 5 - size
+        if need == 0:
+            out[env_ids] = score_hands_batch(hands[env_ids])
+            continue
+
+        slot_ranks, slot_counts = _rank_multiset_slots(need)
+        rows, completion_scores = _completion_scores(size)
+        combo_masks = _rank_combo_masks(need)
+        for start in range(0, len(env_ids), chunk_size):
+            ids = env_ids[start:start + chunk_size]
+            ranks = hands[ids, :size] % 13
+            hand_mask = np.bitwise_or.reduce(_RANK_BITS_NP[ranks], axis=1) if size else np.zeros(len(ids), np.uint64)
+
+            # Non-flush score of every rank multiset, weighted by the ways the deck can supply it:
+            # ways[e, r * 6 + k] = C(deck count of rank r, k), gathered per multiset slot
+            ways = _BINOM_SMALL[deck_counts[ids]].reshape(len(ids), -1)
+            slots = ways[:, slot_ranks * 6 + slot_counts]
+            weights = slots[..., 0]
+            for j in range(1, need):
+                weights = weights * slots[..., j]
+            hand_rows = [rows[tuple(sorted(r))] for r in ranks.tolist()]
+            sums = np.einsum("ij,ij->i", weights, completion_scores[hand_rows])
+
+            # Flush correction over every suit the hand can still flush in
+            suits = hands[ids, 0] // 13
+            single_suit = (hands[ids, :size] // 13 == suits[:, None]).all(axis=1)
+            q = combo_masks[None] | hand_mask[:, None]
+            gain = flushes[q] - unique_5[q]
+            for s in (range(4) if size == 0 else [None]):
+                suit_mask = suit_masks[ids, s] if s is not None else suit_masks[ids, suits]
+                inside = (combo_masks[None] & ~suit_mask[:, None]) == 0
+                if s is None:
+                    inside &= single_suit[:, None]
+                sums += np.where(inside, gain, 0).sum(axis=1)
+
+            totals = np.array([comb(deck_sizes[e], need) for e in ids.tolist()], dtype=np.int64)
+            out[ids] = np.where(totals > 0, sums / np.maximum(totals, 1), 7462.0)
+
+    for e, key in keys.items():
+        EVAL_CACHE.put(key, float(out[e]))
+    return out
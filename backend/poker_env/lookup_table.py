@@ -0,0 +1,124 @@
+"""Precomputed best-hand tables for whole card pools.
+
+Entry i of the table for n cards holds the best 5-card cactus kev score of the
+n-card set whose colex (combinatorial number system) rank is i. Tables are flat
+uint16 files opened with numpy.memmap, so every process reading them shares one
+copy in the page cache.
+
+Generate them once with:
+    python -m poker_env.lookup_table --cards 7 8
+"""
+import argparse
+import os
+import time
+from functools import lru_cache
+from math import comb
+import numpy as np
+from .evaluator import score_hands_batch
+
+TABLE_DIR = os.environ.get("POKER_TABLE_DIR", os.path.join(os.path.dirname(__file__), "tables"))
+
+_BINOM = [[comb(n, k) for k in range(10)] for n in range(52)]
+_BINOM_NP = np.array(_BINOM, dtype=np.int64)
+
+
+def hand_index(card_ids):
+    """Colex rank of a set of distinct card IDs among all sets of the same size."""
+    return sum(_BINOM[c][i + 1] for i, c in enumerate(sorted(card_ids)))
+
+
+def table_path(num_cards, table_dir=TABLE_DIR):
+    return os.path.join(table_dir, f"best_hand_{num_cards}.bin")
+
+
+@lru_cache(maxsize=None)
+def load_table(num_cards, table_dir=TABLE_DIR):
+    """Memory-map the table for num_cards, or return None if it was never generated."""
+    path = table_path(num_cards, table_dir)
+    if not os.path.exists(path):
+        return None
+    return np.memmap(path, dtype=np.uint16, mode="r", shape=(comb(52, num_cards),))
+
+
+def table_score(card_ids):
+    """Best 5-card score of card_ids with a single table read, or None if no table covers it."""
+    table = load_table(len(card_ids))
+    if table is None:
+        return None
+    return int(table[hand_index(card_ids)])
+
+
+def _unrank(indices, k):
+    """[N, k] ascending card IDs for an array of colex ranks."""
+    rem = indices.copy()
+    cards = np.empty((len(indices), k), dtype=np.int64)
+    for i in range(k, 0, -1):
+        c = np.searchsorted(_BINOM_NP[:, i], rem, side="right") - 1
+        cards[:, i - 1] = c
+        rem -= _BINOM_NP[c, i]
+    return cards
+
+
+def _fill_table(out, k, prev, chunk_size):
+    """Fill out[i] with the best score of the i-th k-card set.
+
+    For k == 5 hands are scored directly; otherwise each entry is the minimum
+    of prev (the (k-1)-card table) over the k subsets missing one card.
+    """
+    positions = np.arange(k)
+    for start in range(0, len(out), chunk_size):
+        end = min(start + chunk_size, len(out))
+        cards = _unrank(np.arange(start, end, dtype=np.int64), k)
+        if k == 5:
+            out[start:end] = score_hands_batch(cards)
+            continue
+
+        # Dropping card j keeps the colex terms C(c_i, i + 1) below j and
+        # shifts the terms above j down to C(c_i, i).
+        kept = _BINOM_NP[cards, positions + 1]
+        shifted = _BINOM_NP[cards, positions]
+        below = np.cumsum(kept, axis=1) - kept
+        above = np.cumsum(shifted[:, ::-1], axis=1)[:, ::-1] - shifted
+
+        best = prev[below[:, 0] + above[:, 0]]
+        for j in range(1, k):
+            np.minimum(best, prev[below[:, j] + above[:, j]], out=best)
+        out[start:end] = best
+
+
+def generate_tables(sizes, table_dir=TABLE_DIR, chunk_size=1 << 20):
+    """Build the tables for every pool size in sizes and write them to table_dir.
+
+    Smaller tables are built in memory as stepping stones; only the requested
+    sizes are written, each to a temporary file renamed into place when done.
+    """
+    os.makedirs(table_dir, exist_ok=True)
+    prev = None
+    for k in range(5, max(sizes) + 1):
+        start = time.time()
+        total = comb(52, k)
+        if k in sizes:
+            tmp_path = table_path(k, table_dir) + ".tmp"
+            table = np.memmap(tmp_path, dtype=np.uint16, mode="w+", shape=(total,))
+        else:
+            table = np.empty(total, dtype=np.uint16)
+
+        _fill_table(table, k, prev, chunk_size)
+
+        if k in sizes:
+            table.flush()
+            del table
+            os.replace(tmp_path, table_path(k, table_dir))
+            table = np.memmap(table_path(k, table_dir), dtype=np.uint16, mode="r", shape=(total,))
+            print(f"Wrote {table_path(k, table_dir)} ({total} entries) in {time.time() - start:.1f}s")
+        prev = table
+    load_table.cache_clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate memory-mapped best-hand lookup tables.")
+    parser.add_argument("--cards", type=int, nargs="+", default=[7], choices=[5, 6, 7, 8, 9],
+                        help="pool sizes to generate (default: 7)")
+    parser.add_argument("--out", default=TABLE_DIR, help="output directory")
+    args = parser.parse_args()
+    generate_tables(set(args.cards), args.out)
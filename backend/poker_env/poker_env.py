@@ -1,25 +1,19 @@
 import itertools
 import random
-from itertools import combinations
-from .card_utils import hand_to_str, id_to_numeric, id_to_card
-from .poker_data import *
-
-# Cactus Kev encoding setup
-_SUITS = [1 << (i + 12) for i in range(4)]
-_RANKS = [(1 << (i + 16)) | (i << 8) for i in range(13)]
-_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
-_DECK = [_RANKS[r] | _SUITS[s] | _PRIMES[r] for r, s in itertools.product(range(13), range(4))]
-_HAND_NAMES = [
-    "High Card", "One Pair", "Two Pair", "Three of a Kind",
-    "Straight", "Flush", "Full House", "Four of a Kind", "Straight Flush"
-]
+from itertools import accumulate, combinations
+from operator import or_
+from .card_utils import hand_to_str, id_to_numeric, id_to_card, cards_to_mask
+from .eval_cache import EVAL_CACHE
+from .evaluator import (_DECK, HAND_NAMES, score_ids, score_hands_batch, best_hand, hand_category,
+                        expected_score_exact)
+from .lookup_table import table_score
 
 def best_5_cards(self, card_ids):
     """Return the best 5-card combination from a list of card IDs."""
     best_score = float("inf")
     best_hand = []
     for combo in combinations(card_ids, 5):
-        score = self.score_hand(self.ids_to_rank_suit(combo))
+        score = score_ids(*combo)
         if score < best_score:
             best_score = score
             best_hand = list(combo)
@@ -39,15 +33,72 @@ DECK = [''.join(s) for s in itertools.product(RANKS, SUITS)]
 LOOKUP = dict(zip(DECK, _DECK))
 
 
+class BestHandTracker:
+    """A growing card pool that caches its best 5-card hand.
+
+    Adding cards only extends the pool; the best hand is evaluated at most once
+    per pool size and reused until more cards arrive. Appending to `cards`
+    directly is also picked up, since the cache is keyed on the pool size.
+    """
+
+    def __init__(self, cards=None):
+        self.cards = list(cards) if cards else []
+        self._best = None
+        self._score = None
+        self._size = -1
+        self._mask = 0
+        self._mask_size = 0
+
+    def add(self, cards, mask=None):
+        """Extend the pool; mask, if given, is the bitmask of the new cards."""
+        if mask is not None and self._mask_size == len(self.cards):
+            self._mask |= mask
+            self._mask_size += len(cards)
+        self.cards.extend(cards)
+
+    @property
+    def mask(self):
+        """Bitmask of the pool's cards (bit c set for card c)."""
+        for c in self.cards[self._mask_size:]:
+            self._mask |= 1 << c
+        self._mask_size = len(self.cards)
+        return self._mask
+
+    def _refresh(self):
+        if self._size != len(self.cards):
+            self._best = None
+            self._score = None
+            self._size = len(self.cards)
+
+    def best(self):
+        """Return (score, hand) of the best 5-card hand, or (-1, []) below 5 cards."""
+        self._refresh()
+        if self._best is None:
+            self._best = best_hand(self.cards) if len(self.cards) >= 5 else (-1, [])
+            self._score = self._best[0]
+        return self._best
+
+    def score(self):
+        """Best 5-card score, read from a precomputed lookup table when one covers the pool."""
+        self._refresh()
+        if self._score is None:
+            self._score = table_score(self.cards)
+            if self._score is None:
+                self._score = self.best()[0]
+        return self._score
+
+
 class OnePlayerPokerEnv:
-    def __init__(self):
+    def __init__(self, exact_shaping=False):
+        self.exact_shaping = exact_shaping
         self.reset()
 
     def reset(self):
-        self.deck = list(range(52))
-        random.shuffle(self.deck)
+        deck = list(range(52))
+        random.shuffle(deck)
+        self.deck = deck
         self.player_hand = []
-        self.opponent_cards = []
+        self.opponent_tracker = BestHandTracker()
         self.round = 0
         self.done = False
         return self.get_observation()
@@ -56,19 +107,24 @@ class OnePlayerPokerEnv:
         """Draw from deck until a target card is found."""
         if self.done:
             raise Exception("Game is over. Call reset().")
-        assert all(card in self.deck for card in action_subset), "Invalid action"
-
-        discarded = []
-        while self.deck:
-            card = self.deck.pop(0)
-            if card in action_subset:
-                self.player_hand.append(card)
-                break
-            discarded.append(card)
-        self.opponent_cards.extend(discarded)
+        action_mask = cards_to_mask(action_subset)
+        assert action_mask & ~self.deck_mask == 0, "Invalid action"
+
+        # The first target in draw order is the one with the lowest deck position
+        end = len(self._order)
+        target = min(map(self._position.__getitem__, action_subset), default=end)
+        discarded = self._order[self._cursor:target]
+        discarded_mask = self._suffix_masks[self._cursor] ^ self._suffix_masks[target]
+        if target < end:
+            card = self._order[target]
+            self._hand.append(card)
+            self.hand_mask |= 1 << card
+            target += 1
+        self._cursor = target
+        self.opponent_tracker.add(discarded, discarded_mask)
 
         self.round += 1
-        if len(self.player_hand) == 5 or not self.deck:
+        if len(self.player_hand) == 5 or self._cursor == end:
             self.done = True
 
         if self.done:
@@ -79,12 +135,53 @@ class OnePlayerPokerEnv:
 
         return self.get_observation(), reward, self.done, {}
 
+    @property
+    def deck(self):
+        """Cards left to draw, in draw order."""
+        return self._order[self._cursor:]
+
+    @deck.setter
+    def deck(self, cards):
+        """Replace the draw order and rebuild the position index and suffix masks."""
+        self._order = list(cards)
+        self._cursor = 0
+        self._position = [len(self._order)] * 52
+        for i, card in enumerate(self._order):
+            self._position[card] = i
+        bits = [1 << card for card in reversed(self._order)]
+        self._suffix_masks = list(accumulate(bits, or_, initial=0))[::-1]
+
+    @property
+    def deck_mask(self):
+        return self._suffix_masks[self._cursor]
+
+    @property
+    def player_hand(self):
+        return self._hand
+
+    @player_hand.setter
+    def player_hand(self, cards):
+        """Replace the hand and rebuild its mask."""
+        self._hand = list(cards)
+        self.hand_mask = cards_to_mask(self._hand)
+
+    @property
+    def opponent_cards(self):
+        return self.opponent_tracker.cards
+
+    @opponent_cards.setter
+    def opponent_cards(self, cards):
+        self.opponent_tracker = BestHandTracker(cards)
+
     def get_observation(self):
         return {
             "round": self.round,
             "player_hand": self.player_hand.copy(),
             "opponent_cards": self.opponent_cards.copy(),
-            "deck_size": len(self.deck),
+            "deck_size": len(self._order) - self._cursor,
+            "deck_mask": self.deck_mask,
+            "hand_mask": self.hand_mask,
+            "opponent_mask": self.opponent_tracker.mask,
         }
 
     def get_reward(self):
@@ -92,11 +189,15 @@ class OnePlayerPokerEnv:
         if len(self.player_hand) < 5:
             return -1
 
-        while len(self.opponent_cards) < 8 and self.deck:
-            self.opponent_cards.append(self.deck.pop(0))
+        fill = min(8 - len(self.opponent_cards), len(self._order) - self._cursor)
+        if fill > 0:
+            start = self._cursor
+            self._cursor += fill
+            self.opponent_tracker.add(self._order[start:self._cursor],
+                                      self._suffix_masks[start] ^ self._suffix_masks[self._cursor])
 
-        player_score = self.score_hand(self.ids_to_rank_suit(self.player_hand))
-        opp_score, _ = self.best_opponent_hand_rank()
+        player_score = score_ids(*self.player_hand)
+        opp_score = self.best_opponent_score()
 
         return int(player_score < opp_score) - int(player_score > opp_score)
 
@@ -105,34 +206,15 @@ class OnePlayerPokerEnv:
 
     def score_hand(self, hand):
         """Return cactus kev score from 5 (rank, suit) tuples."""
-
-        def hash_function(x):
-            x += 0xe91aaa35
-            x ^= x >> 16
-            x += x << 8
-            x &= 0xffffffff
-            x ^= x >> 4
-            b = (x >> 8) & 0x1ff
-            a = (x + (x << 2)) >> 19
-            r = (a ^ HASH_ADJUST[b]) & 0x1fff
-            return HASH_VALUES[r]
-
         try:
-            card_strs = [self.cactus_to_str(rank, suit) for rank, suit in hand]
-            c1, c2, c3, c4, c5 = (LOOKUP[c] for c in card_strs)
+            for rank, suit in hand:
+                if not (2 <= rank <= 14 and 0 <= suit <= 3):
+                    raise ValueError(f"no card with rank {rank} and suit {suit}")
+            c1, c2, c3, c4, c5 = (suit * 13 + rank - 2 for rank, suit in hand)
+            return score_ids(c1, c2, c3, c4, c5)
         except Exception as e:
             raise ValueError(f"Card conversion failed: {e}")
 
-        q = (c1 | c2 | c3 | c4 | c5) >> 16
-        if (0xf000 & c1 & c2 & c3 & c4 & c5):
-            return FLUSHES[q]
-        s = UNIQUE_5[q]
-        if s:
-            return s
-
-        p = (c1 & 0xff) * (c2 & 0xff) * (c3 & 0xff) * (c4 & 0xff) * (c5 & 0xff)
-        return hash_function(p)
-
     def cactus_to_str(self, rank, suit):
         return RANKS[rank - 2] + SUITS[suit]
 
@@ -172,6 +254,10 @@ class OnePlayerPokerEnv:
     def partial_hand_score(self, hand):
         """Simple heuristic for <5-card hands."""
         if not hand: return 0.0
+        key = ("partial", cards_to_mask(hand))
+        cached = EVAL_CACHE.get(key)
+        if cached is not None:
+            return cached
         ranks = [c % 13 for c in hand]
         suits = [c // 13 for c in hand]
 
@@ -186,34 +272,37 @@ class OnePlayerPokerEnv:
             gap = sorted_ranks[i + 1] - sorted_ranks[i]
             score += 3 if gap == 1 else 1 if gap == 2 else 0
 
+        EVAL_CACHE.put(key, float(score))
         return float(score)
 
-    def expected_hand_score(self, num_samples=100):
-        """Monte Carlo estimate of the average completed hand score."""
+    def expected_hand_score(self, num_samples=100, exact=None):
+        """Average completed hand score, exact or as a Monte Carlo estimate.
+
+        exact defaults to self.exact_shaping. The exact mode averages over every
+        completion from the remaining deck; the estimate uses num_samples draws.
+        """
         if len(self.player_hand) >= 5:
-            return self.score_hand(self.ids_to_rank_suit(self.player_hand))
+            return score_ids(*self.player_hand)
+        if exact is None:
+            exact = self.exact_shaping
+        if exact:
+            return expected_score_exact(self.player_hand, self.deck)
 
-        scores = []
         pool = [c for c in self.deck if c not in self.player_hand]
+        if len(pool) < 5 - len(self.player_hand):
+            return 7462.0
+        hands = [self.player_hand + random.sample(pool, 5 - len(self.player_hand))
+                 for _ in range(num_samples)]
 
-        for _ in range(num_samples):
-            draw = random.sample(pool, 5 - len(self.player_hand))
-            full_hand = self.player_hand + draw
-            rank_suit = self.ids_to_rank_suit(full_hand)
-            scores.append(self.score_hand(rank_suit))
-
-        return sum(scores) / len(scores)
+        return float(score_hands_batch(hands).mean())
 
     def best_opponent_hand_rank(self):
         """Return (score, hand) for best opponent 5-card combo."""
-        if len(self.opponent_cards) < 5:
-            return -1, []
-        best = (10 ** 6, [])
-        for combo in combinations(self.opponent_cards, 5):
-            score = self.score_hand(self.ids_to_rank_suit(combo))
-            if score < best[0]:
-                best = (score, list(combo))
-        return best
+        return self.opponent_tracker.best()
+
+    def best_opponent_score(self):
+        """Best opponent 5-card score, from a precomputed lookup table when one covers the pool."""
+        return self.opponent_tracker.score()
 
     def best_opponent_hand(self):
         """Return string version of best 5-card opponent hand."""
@@ -222,21 +311,18 @@ class OnePlayerPokerEnv:
 
     def best_5_cards(self, card_ids):
         """Return the best 5-card combination from a list of card IDs."""
-        best_score = float("inf")
-        best_hand = []
-        for combo in combinations(card_ids, 5):
-            score = self.score_hand(self.ids_to_rank_suit(combo))
-            if score < best_score:
-                best_score = score
-                best_hand = list(combo)
-        return best_hand
+        key = ("best", cards_to_mask(card_ids))
+        hand = EVAL_CACHE.get(key)
+        if hand is None:
+            _, hand = best_hand(card_ids)
+            EVAL_CACHE.put(key, tuple(hand))
+        return list(hand)
 
     def hand_rank_name(self, card_ids):
         """Return the hand name for a 5-card hand."""
         if len(card_ids) != 5:
             return "Incomplete Hand"
-        rank, _ = self.evaluate_hand(card_ids)
-        return _HAND_NAMES[rank]
+        return HAND_NAMES[hand_category(score_ids(*card_ids))]
 
     def render(self):
         print(f"Round: {self.round}")
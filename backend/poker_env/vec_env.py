@@ -0,0 +1,117 @@
+import numpy as np
+from .evaluator import best_hand, expected_scores_batch, score_hands_batch
+from .lookup_table import table_score
+
+
+class VecOnePlayerPokerEnv:
+    """num_envs independent games of OnePlayerPokerEnv stepped in lockstep.
+
+    State is held as [num_envs, ...] arrays: the deck permutation and its
+    inverse, a draw cursor, the player's hand, boolean card masks and round
+    counters. Finished games are reset automatically at the end of step.
+    Rules and rewards match OnePlayerPokerEnv(exact_shaping=True) for the same
+    deck permutation.
+    """
+
+    def __init__(self, num_envs, seed=None):
+        self.num_envs = num_envs
+        self.rng = np.random.default_rng(seed)
+        self.order = np.zeros((num_envs, 52), dtype=np.int64)
+        self.position = np.zeros((num_envs, 52), dtype=np.int64)
+        self.cursor = np.zeros(num_envs, dtype=np.int64)
+        self.hand = np.zeros((num_envs, 5), dtype=np.int64)
+        self.hand_size = np.zeros(num_envs, dtype=np.int64)
+        self.hand_mask = np.zeros((num_envs, 52), dtype=bool)
+        self.opponent_mask = np.zeros((num_envs, 52), dtype=bool)
+        self.round = np.zeros(num_envs, dtype=np.int64)
+        self.reset()
+
+    def reset(self, orders=None, env_ids=None):
+        """Start new games for env_ids (default: all) with random or given deck orders."""
+        if env_ids is None:
+            env_ids = np.arange(self.num_envs)
+        if orders is None:
+            orders = np.argsort(self.rng.random((len(env_ids), 52)), axis=1)
+        orders = np.asarray(orders, dtype=np.int64)
+
+        self.order[env_ids] = orders
+        self.position[env_ids[:, None], orders] = np.arange(52)
+        self.cursor[env_ids] = 0
+        self.hand[env_ids] = 0
+        self.hand_size[env_ids] = 0
+        self.hand_mask[env_ids] = False
+        self.opponent_mask[env_ids] = False
+        self.round[env_ids] = 0
+        return self.get_observation()
+
+    @property
+    def deck_mask(self):
+        return self.position >= self.cursor[:, None]
+
+    def get_observation(self):
+        return {
+            "round": self.round.copy(),
+            "deck_mask": self.deck_mask,
+            "hand_mask": self.hand_mask.copy(),
+            "opponent_mask": self.opponent_mask.copy(),
+            "deck_size": 52 - self.cursor,
+        }
+
+    def step(self, action_mask):
+        """Step every game with a [num_envs, 52] boolean action mask.
+
+        Returns (obs, rewards, dones, infos); obs is already that of the reset
+        game wherever dones is True, and infos["final_observation"] holds the
+        observation each game finished on.
+        """
+        action_mask = np.asarray(action_mask, dtype=bool)
+        assert not (action_mask & ~self.deck_mask).any(), "Invalid action"
+        envs = np.arange(self.num_envs)
+
+        # First target in draw order: lowest deck position over the action subset
+        target = np.where(action_mask, self.position, 52).min(axis=1)
+        self.opponent_mask |= (self.position >= self.cursor[:, None]) & (self.position < target[:, None])
+        found = target < 52
+        cards = self.order[envs[found], target[found]]
+        self.hand[envs[found], self.hand_size[found]] = cards
+        self.hand_mask[envs[found], cards] = True
+        self.hand_size += found
+        self.cursor = np.where(found, target + 1, 52)
+
+        self.round += 1
+        dones = (self.hand_size == 5) | (self.cursor == 52)
+        rewards = np.zeros(self.num_envs, dtype=np.float64)
+        if (~dones).any():
+            live = np.flatnonzero(~dones)
+            scores = expected_scores_batch(self.hand[live], self.hand_size[live], self.deck_mask[live])
+            rewards[~dones] = 0.08 * (1.0 - scores / 7462.0)
+        if dones.any():
+            rewards[dones] = self._terminal_rewards(np.flatnonzero(dones))
+
+        infos = {"final_observation": self.get_observation()}
+        if dones.any():
+            self.reset(env_ids=np.flatnonzero(dones))
+        return self.get_observation(), rewards, dones, infos
+
+    def _terminal_rewards(self, env_ids):
+        """+1 win, 0 draw, -1 loss; the opponent pool is first topped up to 8 cards from the deck."""
+        rewards = np.full(len(env_ids), -1.0)
+        complete = self.hand_size[env_ids] == 5
+        env_ids = env_ids[complete]
+        if not len(env_ids):
+            return rewards
+
+        fill = np.clip(8 - self.opponent_mask[env_ids].sum(axis=1), 0, 52 - self.cursor[env_ids])
+        end = self.cursor[env_ids] + fill
+        position = self.position[env_ids]
+        self.opponent_mask[env_ids] |= (position >= self.cursor[env_ids, None]) & (position < end[:, None])
+        self.cursor[env_ids] = end
+
+        player = score_hands_batch(self.hand[env_ids])
+        opponent = np.empty(len(env_ids), dtype=np.int64)
+        for i, pool in enumerate(self.opponent_mask[env_ids]):
+            cards = np.flatnonzero(pool).tolist()
+            score = table_score(cards)
+            opponent[i] = score if score is not None else best_hand(cards)[0]
+        rewards[complete] = (player < opponent).astype(np.float64) - (player > opponent)
+        return rewards
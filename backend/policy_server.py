@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from metrics import LatencyStats
+
+try:
+    import torch
+    from agent.model import ActorCriticNetwork, PolicyNetwork
+    from agent.runner import encode_observation
+except ImportError:  # the game itself runs without torch and the agent package; only /suggest needs them
+    torch = None
+
+logger = logging.getLogger(__name__)
+
+
+class PolicyServer:
+    """Serve a trained policy, batching concurrent requests into one forward pass.
+
+    suggest() queues one observation and waits. A background task takes the
+    first queued request, keeps collecting until max_batch_size are waiting or
+    max_wait_ms has passed since it arrived, and runs them through the network
+    together under torch.inference_mode.
+    """
+
+    def __init__(self, policy_net, max_batch_size=32, max_wait_ms=5.0):
+        self.policy_net = policy_net.eval()
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batch_sizes = Counter()
+        self.latency = LatencyStats()
+        self._queue = None
+        self._task = None
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """A server for the checkpoint at path, or None without torch or a loadable checkpoint.
+
+        Accepts the policy.pth of separate networks and the actor_critic.pth
+        written with shared_trunk; only the policy logits are used.
+        """
+        if torch is None or not os.path.exists(path):
+            return None
+        try:
+            state_dict = torch.load(path, map_location='cpu')
+            policy_net = ActorCriticNetwork() if 'policy_head.weight' in state_dict else PolicyNetwork()
+            policy_net.load_state_dict(state_dict)
+        except Exception:
+            logger.exception("could not load policy checkpoint %s, /suggest is disabled", path)
+            return None
+        return cls(policy_net, **kwargs)
+
+    def logits(self, obs):
+        logits = self.policy_net(obs)
+        # An actor-critic returns (logits, value)
+        return logits[0] if isinstance(logits, tuple) else logits
+
+    def _ensure_running(self):
+        # The batching task lives on the loop that serves requests; start it on first use
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._serve())
+
+    async def suggest(self, obs_dict):
+        """(cards, probabilities) for one game: the cards the policy picks and all 52 selection probabilities."""
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((encode_observation(obs_dict), future, time.perf_counter()))
+        return await future
+
+    async def _serve(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            start = time.perf_counter()
+            try:
+                results = self.predict(torch.stack([obs for obs, _, _ in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            now = time.perf_counter()
+            self.latency.record('forward', now - start)
+            self.batch_sizes[len(batch)] += 1
+            for (_, future, queued), result in zip(batch, results):
+                self.latency.record('request', now - queued)
+                if not future.done():
+                    future.set_result(result)
+
+    def predict(self, obs):
+        """Per-card selection probabilities for a batch of encoded observations, and the chosen subsets.
+
+        As in rollouts, each legal card is picked independently with
+        probability sigmoid(logit); the suggestion is the most likely subset
+        (every card above 0.5), or the single most likely card if that is empty.
+        """
+        with torch.inference_mode():
+            # The observation starts with the deck mask, i.e. the cards that could be chosen
+            probs = torch.sigmoid(self.logits(obs)) * obs[:, :52]
+            chosen = probs > 0.5
+            empty = ~chosen.any(dim=1)
+            chosen[empty, probs[empty].argmax(dim=1)] = True
+        return [(torch.nonzero(row).flatten().tolist(), p.tolist()) for row, p in zip(chosen, probs)]
+
+    def stats(self):
+        batches = sum(self.batch_sizes.values())
+        requests = sum(size * count for size, count in self.batch_sizes.items())
+        return {
+            'batches': batches,
+            'requests': requests,
+            'mean_batch_size': requests / batches if batches else 0.0,
+            'batch_sizes': dict(sorted(self.batch_sizes.items())),
+            'latency': self.latency.summary(),
+        }
@@ -0,0 +1,97 @@
+import asyncio
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+
+class Session:
+    __slots__ = ('id', 'env', 'lock', 'last_used')
+
+    def __init__(self, session_id, env):
+        self.id = session_id
+        self.env = env
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+
+class SessionStore:
+    """In-memory games keyed by session token, with LRU and idle-TTL eviction.
+
+    Sessions are kept in least-recently-used order, so expired ones are always
+    at the front. create() first drops sessions idle for more than ttl seconds
+    and then, if the store is still full, the least recently used one, so at
+    most max_sessions envs are ever alive. Handlers hold session.lock (an
+    asyncio lock) while playing a move, so one player's requests run in order.
+    """
+
+    def __init__(self, env_factory, max_sessions=1000, ttl=1800.0, clock=time.monotonic):
+        self.env_factory = env_factory
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _evict_expired(self, now):
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_used <= self.ttl:
+                break
+            self._sessions.popitem(last=False)
+            self.expired += 1
+
+    def evict_expired(self):
+        with self._lock:
+            self._evict_expired(self.clock())
+
+    def create(self):
+        """Start a session with a fresh env and return it."""
+        env = self.env_factory()
+        session = Session(secrets.token_urlsafe(16), env)
+        with self._lock:
+            now = self.clock()
+            self._evict_expired(now)
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+            session.last_used = now
+            self._sessions[session.id] = session
+            self.created += 1
+        return session
+
+    def get(self, session_id):
+        """The live session for session_id, marked as just used; None if unknown or expired."""
+        if not session_id:
+            return None
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            now = self.clock()
+            if now - session.last_used > self.ttl:
+                del self._sessions[session_id]
+                self.expired += 1
+                return None
+            session.last_used = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def stats(self):
+        return {
+            'sessions': len(self._sessions),
+            'max_sessions': self.max_sessions,
+            'created': self.created,
+            'expired': self.expired,
+            'evicted': self.evicted,
+        }
@@ -0,0 +1,252 @@
+"""Benchmark cases. Each returns {name: (value, unit, higher_is_better)}."""
+import asyncio
+import random
+import time
+import numpy as np
+import torch
+from functools import partial
+
+from poker_env.eval_cache import EVAL_CACHE
+from poker_env.poker_env import OnePlayerPokerEnv
+from poker_env.vec_env import VecOnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+from agent.runner import collect_rollouts, collect_rollouts_batched, encode_observation
+
+
+def seed_all(seed=0):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def best_of(fn, repeat):
+    """Fastest of `repeat` runs of fn(), in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_game_states(num_games, exact_shaping=False):
+    """(player_hand, deck) after every non-terminal step of random games."""
+    states = []
+    for _ in range(num_games):
+        env = OnePlayerPokerEnv(exact_shaping=exact_shaping)
+        while not env.done:
+            env.step(random.sample(env.deck, min(random.randint(2, 10), len(env.deck))))
+            if not env.done:
+                states.append((list(env.player_hand), list(env.deck)))
+    return states
+
+
+def bench_evaluator(repeat):
+    seed_all()
+    env = OnePlayerPokerEnv()
+    hands = [[(c % 13 + 2, c // 13) for c in random.sample(range(52), 5)] for _ in range(2000)]
+    score = best_of(lambda: [env.score_hand(h) for h in hands], repeat) / len(hands)
+    results = {"evaluator.score_hand": (score * 1e6, "us/call", False)}
+
+    for size in (7, 8):
+        pools = [random.sample(range(52), size) for _ in range(500)]
+
+        def run():
+            for pool in pools:
+                env.opponent_cards = pool
+                env.best_opponent_hand_rank()
+        results[f"evaluator.best_opponent_hand_rank.{size}_cards"] = (
+            best_of(run, repeat) / len(pools) * 1e6, "us/call", False)
+
+    states = random_game_states(100)
+    for exact in (False, True):
+        def run():
+            for hand, deck in states:
+                env.player_hand, env.deck = hand, deck
+                env.expected_hand_score(exact=exact)
+        # Exact scores are memoized; measure the computation, not the cache
+        enabled, EVAL_CACHE.enabled = EVAL_CACHE.enabled, False
+        try:
+            seed_all()
+            elapsed = best_of(run, repeat)
+        finally:
+            EVAL_CACHE.enabled = enabled
+        name = "exact" if exact else "monte_carlo"
+        results[f"evaluator.expected_hand_score.{name}"] = (elapsed / len(states) * 1e6, "us/call", False)
+    return results
+
+
+def bench_env(repeat):
+    results = {}
+    seed_all()
+    env = OnePlayerPokerEnv()
+    results["env.reset"] = (best_of(lambda: [env.reset() for _ in range(2000)], repeat) / 2000 * 1e6,
+                            "us/call", False)
+
+    for exact_shaping in (False, True):
+        def run():
+            seed_all()
+            steps, elapsed = 0, 0.0
+            for _ in range(100):
+                env = OnePlayerPokerEnv(exact_shaping=exact_shaping)
+                while not env.done:
+                    action = random.sample(env.deck, min(random.randint(1, 8), len(env.deck)))
+                    start = time.perf_counter()
+                    env.step(action)
+                    elapsed += time.perf_counter() - start
+                    steps += 1
+            return elapsed / steps
+        # Repeats replay the same games, so keep the evaluation cache from turning them into lookups
+        enabled, EVAL_CACHE.enabled = EVAL_CACHE.enabled, False
+        try:
+            elapsed = min(run() for _ in range(repeat))
+        finally:
+            EVAL_CACHE.enabled = enabled
+        name = "exact_shaping" if exact_shaping else "monte_carlo_shaping"
+        results[f"env.step.{name}"] = (elapsed * 1e6, "us/call", False)
+
+    seed_all()
+    observations = []
+    for _ in range(200):
+        env = OnePlayerPokerEnv()
+        observations.append(env.get_observation())
+        while not env.done:
+            obs, _, _, _ = env.step(random.sample(env.deck, min(3, len(env.deck))))
+            observations.append(obs)
+    results["env.encode_observation"] = (
+        best_of(lambda: [encode_observation(o) for o in observations], repeat) / len(observations) * 1e6,
+        "us/call", False)
+    return results
+
+
+def bench_training(repeat):
+    torch.set_num_threads(1)
+    seed_all()
+    policy_net, value_net = PolicyNetwork(), ValueNetwork()
+    results = {}
+
+    def scalar():
+        seed_all()
+        collect_rollouts(partial(OnePlayerPokerEnv, exact_shaping=True), policy_net, value_net, num_episodes=100)
+    results["rollout.collect_rollouts"] = (100 / best_of(scalar, repeat), "episodes/sec", True)
+
+    def batched():
+        seed_all()
+        collect_rollouts_batched(VecOnePlayerPokerEnv, policy_net, value_net, num_episodes=1000, num_envs=64)
+    results["rollout.collect_rollouts_batched.64_envs"] = (1000 / best_of(batched, repeat), "episodes/sec", True)
+
+    seed_all()
+    buffer = collect_rollouts_batched(VecOnePlayerPokerEnv, policy_net, value_net, num_episodes=1000, num_envs=64)
+
+    def update():
+        seed_all()
+        PPOAgent(PolicyNetwork(), ValueNetwork()).update(buffer)
+    samples = 4 * buffer.size
+    results["ppo.update"] = (samples / best_of(update, repeat), "samples/sec", True)
+    return results
+
+
+async def play_concurrently(app, sessions, players, steps):
+    """Latencies of /step with `players` clients playing random moves at once, and how many got a 503."""
+    import httpx
+
+    latencies, rejected = [], 0
+
+    async def player(client):
+        nonlocal rejected
+        headers = {"X-Session-Id": (await client.get("/reset")).json()["session_id"]}
+        session = sessions.get(headers["X-Session-Id"])
+        for _ in range(steps):
+            deck = session.env.deck
+            action = random.sample(deck, min(random.randint(1, 6), len(deck)))
+            start = time.perf_counter()
+            response = await client.post("/step", json={"selected_cards": action}, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code == 503:
+                rejected += 1
+            elif response.json()["done"]:
+                await client.get("/reset", headers=headers)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await asyncio.gather(*(player(client) for _ in range(players)))
+    return latencies, rejected
+
+
+def bench_api(repeat):
+    """/step latency through FastAPI's in-process test client (skipped without fastapi/httpx).
+
+    api.step.* times one player at a time over HTTP and api.ws.step.* over the
+    /ws WebSocket; api.concurrent.* has 32 players sending moves at once, so it
+    includes queueing for the evaluation workers.
+    """
+    try:
+        from fastapi.testclient import TestClient
+        import main
+    except ImportError as e:
+        print(f"skipping API benchmarks: {e}")
+        return {}
+
+    seed_all()
+    best_latencies = None
+    with TestClient(main.app) as client:
+        for _ in range(repeat):
+            session_id = client.get("/reset").json()["session_id"]
+            latencies = []
+            for _ in range(300):
+                # Each step sends the env to a worker and stores the updated copy
+                deck = main.sessions.get(session_id).env.deck
+                action = random.sample(deck, min(random.randint(1, 6), len(deck)))
+                start = time.perf_counter()
+                response = client.post("/step", json={"selected_cards": action})
+                latencies.append(time.perf_counter() - start)
+                if response.json()["done"]:
+                    client.get("/reset")
+            if best_latencies is None or np.median(latencies) < np.median(best_latencies):
+                best_latencies = latencies
+
+        best_socket = None
+        for _ in range(repeat):
+            latencies = []
+            with client.websocket_connect("/ws") as ws:
+                session_id = ws.receive_json()["session_id"]
+                for _ in range(300):
+                    deck = main.sessions.get(session_id).env.deck
+                    action = random.sample(deck, min(random.randint(1, 6), len(deck)))
+                    start = time.perf_counter()
+                    ws.send_json({"type": "step", "cards": action})
+                    delta = ws.receive_json()
+                    latencies.append(time.perf_counter() - start)
+                    if delta["done"]:
+                        ws.send_json({"type": "reset"})
+                        ws.receive_json()
+            if best_socket is None or np.median(latencies) < np.median(best_socket):
+                best_socket = latencies
+
+        best_concurrent = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            latencies, rejected = asyncio.run(play_concurrently(main.app, main.sessions, players=32, steps=20))
+            elapsed = time.perf_counter() - start
+            if best_concurrent is None or np.median(latencies) < np.median(best_concurrent[0]):
+                best_concurrent = latencies, rejected, elapsed
+    latencies, rejected, elapsed = best_concurrent
+    return {
+        "api.step.p50": (float(np.percentile(best_latencies, 50)) * 1e3, "ms", False),
+        "api.step.p95": (float(np.percentile(best_latencies, 95)) * 1e3, "ms", False),
+        "api.ws.step.p50": (float(np.percentile(best_socket, 50)) * 1e3, "ms", False),
+        "api.ws.step.p95": (float(np.percentile(best_socket, 95)) * 1e3, "ms", False),
+        "api.concurrent.p50": (float(np.percentile(latencies, 50)) * 1e3, "ms", False),
+        "api.concurrent.p95": (float(np.percentile(latencies, 95)) * 1e3, "ms", False),
+        "api.concurrent.p99": (float(np.percentile(latencies, 99)) * 1e3, "ms", False),
+        "api.concurrent.throughput": ((len(latencies) - rejected) / elapsed, "steps/sec", True),
+    }
+
+
+CASES = {
+    "evaluator": bench_evaluator,
+    "env": bench_env,
+    "training": bench_training,
+    "api": bench_api,
+}
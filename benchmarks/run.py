@@ -0,0 +1,104 @@
+"""Run the benchmark suite and write JSON results, or compare two result files.
+
+    python benchmarks/run.py --out results.json [--only evaluator env] [--repeat 3]
+    python benchmarks/run.py --compare baseline.json results.json [--threshold 0.1]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "backend")]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(only, repeat):
+    import numpy as np
+    import torch
+    from cases import CASES
+
+    results = {}
+    for group, case in CASES.items():
+        if only and group not in only:
+            continue
+        start = time.perf_counter()
+        for name, (value, unit, higher_is_better) in case(repeat).items():
+            results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+            print(f"{name:<45} {value:12.2f} {unit}")
+        print(f"[{group}: {time.perf_counter() - start:.1f}s]")
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "torch": torch.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Print the relative change per benchmark; returns the names that regressed beyond threshold."""
+    regressions = []
+    print(f"{'benchmark':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<45} {'-':>12} {new['value']:12.2f}      new")
+            continue
+        change = (new["value"] - old["value"]) / old["value"]
+        worse = -change if new["higher_is_better"] else change
+        flag = "  REGRESSION" if worse > threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<45} {old['value']:12.2f} {new['value']:12.2f} {change:+8.1%} {new['unit']}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--only", nargs="+", help="benchmark groups to run: evaluator env training api")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the best one is kept")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare two result files instead of running")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown counted as a regression (default 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        return
+
+    results = run(args.only, args.repeat)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import { useState } from 'react';
 import { useEffect } from 'react';
+import { useRef } from 'react';
 
 const BACKEND_URL = 'https://five-eight-poker.onrender.com';
 
@@ -14,12 +15,41 @@ function App() {
   const [dealt, setDealt] = useState(new Set());
   const [done, setDone] = useState(false);
   const [loading, setLoading] = useState(false);
+  const [connected, setConnected] = useState(false);
+  const [message, setMessage] = useState('');
   const [showIntro, setShowIntro] = useState(true);
   const [score, setScore] = useState({ wins: 0, losses: 0, totalRounds: 0 });
   const [playerBest, setPlayerBest] = useState([]);
   const [opponentBest, setOpponentBest] = useState([]);
   const [playerRank, setPlayerRank] = useState('');
   const [opponentRank, setOpponentRank] = useState('');
+  const socket = useRef(null);
+  const pendingReply = useRef(null);
+
+  // One WebSocket per game: each message is answered with what changed,
+  // a message of the same type or an error
+  const send = (message) => new Promise((resolve, reject) => {
+    if (!socket.current || socket.current.readyState !== WebSocket.OPEN) {
+      reject(new Error('not connected'));
+      return;
+    }
+    pendingReply.current = { expect: message.type, resolve };
+    socket.current.send(JSON.stringify(message));
+  });
+
+  const clearTable = () => {
+    setPlayerHand([]);
+    setOpponentCards([]);
+    setReward(null);
+    setDone(false);
+    setSelected([]);
+    setDealt(new Set());
+
+    setPlayerBest([]);
+    setOpponentBest([]);
+    setPlayerRank('');
+    setOpponentRank('');
+  };
 
   const toggleCard = (cardId) => {
       if (dealt.has(cardId)) return;
@@ -40,33 +70,41 @@ function App() {
       setLoading(true);
 
       try {
-        await new Promise((res) => setTimeout(res, 100));
-
-        const response = await fetch(`${BACKEND_URL}/step`, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ selected_cards: selected }),
-        });
-        const data = await response.json();
+        let data = await send({ type: 'step', cards: selected });
+        while (data.type === 'error' && data.retry_after) {
+          // The server is busy; try again when it says to
+          await new Promise((res) => setTimeout(res, data.retry_after * 1000));
+          data = await send({ type: 'step', cards: selected });
+        }
+        if (data.type === 'error' && data.expired) {
+          // The game timed out on the server; deal a new one rather than leave the player stuck
+          await send({ type: 'reset' });
+          clearTable();
+          setMessage('Your game expired, so a new one was dealt.');
+          return;
+        }
+        if (data.type === 'error') {
+          setMessage(`Move rejected: ${data.detail}`);
+          return;
+        }
+        setMessage('');
 
-        const player = data.observation.player_hand || [];
-        const opponent = data.observation.opponent_cards || [];
+        const drawn = data.card === null ? [] : [data.card];
         const newReward = data.reward;
 
-        setPlayerHand(player);
-        setOpponentCards(opponent);
+        setPlayerHand((prev) => [...prev, ...drawn]);
+        setOpponentCards((prev) => [...prev, ...data.discarded]);
         setReward(newReward);
         setDone(data.done);
 
-        const newlyDealt = new Set([...player, ...opponent]);
-        setDealt((prev) => new Set([...prev, ...newlyDealt]));
+        setDealt((prev) => new Set([...prev, ...drawn, ...data.discarded]));
         setSelected([]);
 
         if (data.done) {
-          setPlayerBest(data.observation.player_best_hand || []);
-          setOpponentBest(data.observation.opponent_best_hand || []);
-          setPlayerRank(data.observation.player_hand_rank || '');
-          setOpponentRank(data.observation.opponent_hand_rank || '');
+          setPlayerBest(data.result.player_best_hand || []);
+          setOpponentBest(data.result.opponent_best_hand || []);
+          setPlayerRank(data.result.player_hand_rank || '');
+          setOpponentRank(data.result.opponent_hand_rank || '');
 
           setScore((prev) => ({
             wins: prev.wins + (newReward > 0 ? 1 : 0),
@@ -75,7 +113,8 @@ function App() {
           }));
         }
       } catch (err) {
-        console.error('Error calling /step:', err);
+        console.error('Error sending move:', err);
+        setMessage('Could not reach the server, try again.');
       } finally {
         setLoading(false);
       }
@@ -84,21 +123,16 @@ function App() {
   const handleReset = async () => {
       setLoading(true);
       try {
-        await new Promise((res) => setTimeout(res, 100));
-        await fetch(`${BACKEND_URL}/reset`);
-        setPlayerHand([]);
-        setOpponentCards([]);
-        setReward(null);
-        setDone(false);
-        setSelected([]);
-        setDealt(new Set());
-
-        setPlayerBest([]);
-        setOpponentBest([]);
-        setPlayerRank('');
-        setOpponentRank('');
+        const data = await send({ type: 'reset' });
+        if (data.type === 'error') {
+          setMessage(`Reset failed: ${data.detail}`);
+          return;
+        }
+        clearTable();
+        setMessage('');
       } catch (err) {
-        console.error('Error calling /reset:', err);
+        console.error('Error resetting game:', err);
+        setMessage('Could not reach the server, try again.');
       } finally {
         setLoading(false);
       }
@@ -107,34 +141,56 @@ function App() {
   useEffect(() => {
       const handleKey = (e) => {
         if (e.key === 'n' || e.key === 'N') {
-          if (!loading && !done && selected.length > 0) handleNext();
+          if (connected && !loading && !done && selected.length > 0) handleNext();
         }
         if (e.key === 'r' || e.key === 'R') {
-          if (!loading) handleReset();
+          if (connected && !loading) handleReset();
         }
       };
 
       window.addEventListener('keydown', handleKey);
       return () => window.removeEventListener('keydown', handleKey);
-  }, [loading, done, selected, handleNext, handleReset]);
+  }, [connected, loading, done, selected, handleNext, handleReset]);
 
   useEffect(() => {
-    const autoReset = async () => {
-    try {
-      await fetch(`${BACKEND_URL}/reset`);
-      setPlayerHand([]);
-      setOpponentCards([]);
-      setReward(null);
-      setDone(false);
-      setSelected([]);
-      setDealt(new Set());
-    } catch (err) {
-      console.error('Auto-reset failed:', err);
-    }
-  };
+    let closed = false;
+
+    // The server starts a new game for every connection, so there is no separate reset call
+    const connect = () => {
+      const ws = new WebSocket(`${BACKEND_URL.replace(/^http/, 'ws')}/ws`);
+      ws.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        const pending = pendingReply.current;
+        if (pending && (data.type === pending.expect || data.type === 'error')) {
+          pendingReply.current = null;
+          pending.resolve(data);
+        } else if (data.type === 'reset') {
+          // Unasked for: the new game the server starts on every (re)connect.
+          // Moves are only sent after it, so it can't be taken for their answer
+          clearTable();
+          setMessage('');
+          setConnected(true);
+        }
+      };
+      ws.onclose = () => {
+        setConnected(false);
+        const pending = pendingReply.current;
+        pendingReply.current = null;
+        if (pending) pending.resolve({ type: 'error', detail: 'connection closed' });
+        // Reconnecting starts a fresh game
+        if (closed) return;
+        clearTable();
+        setTimeout(connect, 1000);
+      };
+      socket.current = ws;
+    };
 
-  autoReset();
-}, []);
+    connect();
+    return () => {
+      closed = true;
+      socket.current.close();
+    };
+  }, []);
 
   return (
     <div className="min-h-screen w-screen bg-green-100 p-6 flex items-center justify-center gap-10">
@@ -265,6 +321,10 @@ function App() {
                 <p className="text-center text-xs mt-1 italic text-gray-600">{opponentRank}</p>
 
 
+            {(message || !connected) && (
+              <p className="mt-4 text-sm text-red-600">{message || 'Connecting to the server...'}</p>
+            )}
+
             {done && (
               <p
                 className={`mt-4 font-semibold text-lg ${
@@ -283,14 +343,14 @@ function App() {
               <button
                 onClick={handleNext}
                 className="bg-green-500 text-white px-4 py-2 rounded hover:bg-green-600 disabled:opacity-50 transition-transform duration-150 active:translate-y-[2px]"
-                disabled={loading || done}
+                disabled={!connected || loading || done}
               >
                 <span className="font-bold underline">N</span>ext
               </button>
               <button
                 onClick={handleReset}
                 className="bg-red-500 text-white px-4 py-2 rounded hover:bg-red-600 disabled:opacity-50 transition-transform duration-150 active:translate-y-[2px]"
-                disabled={loading}
+                disabled={!connected || loading}
               >
                 <span className="font-bold underline">R</span>eset
               </button>
@@ -0,0 +1,23 @@
+"""Shared setup for the backend test scripts.
+
+Importing this puts the repo root and backend/ on sys.path, so the scripts can
+import main and the backend modules. check() prints one PASS/FAIL line per
+check and report() the summary.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "backend")]
+
+failures = 0
+
+
+def check(name, ok, detail=""):
+    global failures
+    failures += not ok
+    print(f"{'PASS' if ok else 'FAIL'}: {name}{' ' + detail if detail else ''}")
+
+
+def report(suite):
+    print(f"All {suite} tests passed" if failures == 0 else f"{failures} {suite} tests FAILED")
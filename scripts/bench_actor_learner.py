@@ -0,0 +1,35 @@
+import os
+import time
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+from agent.runner import collect_rollouts
+from agent.actor_learner import ActorLearner
+
+env_class = partial(OnePlayerPokerEnv, exact_shaping=True)
+episodes_per_batch = 100
+num_updates = 6
+torch.manual_seed(0)
+torch.set_num_threads(1)
+
+# Synchronous: collect, then update, one phase at a time
+agent = PPOAgent(PolicyNetwork(), ValueNetwork())
+start = time.perf_counter()
+for _ in range(num_updates):
+    agent.update(collect_rollouts(env_class, agent.policy_net, agent.value_net, num_episodes=episodes_per_batch))
+sync = time.perf_counter() - start
+print(f"cores: {os.cpu_count()}")
+print(f"synchronous:       {num_updates / sync:6.2f} updates/sec")
+
+for num_actors in (1, 2, 4):
+    agent = PPOAgent(PolicyNetwork(), ValueNetwork())
+    with ActorLearner(env_class, agent, num_actors=num_actors, episodes_per_batch=episodes_per_batch,
+                      queue_depth=2, max_staleness=2, seed=0) as actor_learner:
+        for _ in range(num_updates):
+            actor_learner.step()
+        stats = actor_learner.stats()
+    print(f"async, {num_actors} actors:  {num_updates / stats['wall_time']:6.2f} updates/sec | overlap {stats['overlap']:.2f}"
+          f" | learner utilization {stats['learner_utilization']:.0%} | mean staleness {stats['mean_staleness']:.2f}"
+          f" | dropped {stats['dropped_batches']}")
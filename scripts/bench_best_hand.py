@@ -0,0 +1,19 @@
+import random
+import timeit
+from env.evaluator import best_hand, best_hand_batch, score_ids
+from itertools import combinations
+
+
+def enumerate_combos(cards):
+    return min(score_ids(*c) for c in combinations(cards, 5))
+
+
+random.seed(0)
+print(f"{'cards':>5} {'combinations':>14} {'batch':>12} {'best_hand':>12}")
+for n in (5, 6, 7, 8, 10, 12, 16):
+    pools = [random.sample(range(52), n) for _ in range(200)]
+    row = []
+    for fn in (enumerate_combos, best_hand_batch, best_hand):
+        t = min(timeit.repeat(lambda: [fn(p) for p in pools], number=1, repeat=3)) / len(pools)
+        row.append(f"{t * 1e6:10.1f}us")
+    print(f"{n:>5} {row[0]:>14} {row[1]:>12} {row[2]:>12}")
@@ -0,0 +1,39 @@
+import random
+import time
+from env.poker_env import OnePlayerPokerEnv
+from env.eval_cache import EVAL_CACHE
+
+# Record the (hand, deck) state after every non-terminal step of random games
+random.seed(0)
+states = []
+for _ in range(500):
+    env = OnePlayerPokerEnv()
+    while not env.done:
+        env.step(random.sample(env.deck, min(random.randint(2, 10), len(env.deck))))
+        if not env.done:
+            states.append((list(env.player_hand), list(env.deck)))
+
+env = OnePlayerPokerEnv()
+
+
+def run(exact):
+    start = time.perf_counter()
+    for hand, deck in states:
+        env.player_hand, env.deck = hand, deck
+        env.expected_hand_score(exact=exact)
+    return (time.perf_counter() - start) / len(states)
+
+
+mc = run(exact=False)
+EVAL_CACHE.clear()
+cold = run(exact=True)
+info = EVAL_CACHE.stats()
+warm = run(exact=True)
+
+print(f"states: {len(states)}")
+print(f"Monte Carlo (100 samples): {mc * 1e6:8.1f} us/call")
+print(f"exact, first pass:         {cold * 1e6:8.1f} us/call (cache hits {info['hits']}/{info['hits'] + info['misses']})")
+print(f"exact, warm cache:         {warm * 1e6:8.1f} us/call")
+
+EVAL_CACHE.enabled = False
+print(f"exact, cache disabled:     {run(exact=True) * 1e6:8.1f} us/call")
@@ -0,0 +1,43 @@
+import time
+import torch
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+
+agent = PPOAgent(PolicyNetwork(), ValueNetwork())
+
+
+def loop_gae(rewards, values, dones, gamma=0.99, lam=1.0):
+    """The previous per-step implementation, for comparison."""
+    returns, advantages = [], []
+    gae = 0
+    next_value = 0
+    for t in reversed(range(len(rewards))):
+        mask = 1.0 - dones[t].item()
+        delta = rewards[t] + gamma * next_value * mask - values[t]
+        gae = delta + gamma * lam * mask * gae
+        next_value = values[t]
+        advantages.insert(0, gae)
+        returns.insert(0, gae + values[t])
+    return torch.stack(returns), torch.stack(advantages)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+torch.manual_seed(0)
+for transitions in (10_000, 100_000, 1_000_000):
+    # Episodes of 1-5 steps, like the poker env
+    rewards, values = torch.randn(transitions, 1), torch.randn(transitions, 1)
+    dones = (torch.rand(transitions, 1) < 0.25).float()
+    dones[-1] = 1.0
+
+    loop = f"{timed(loop_gae, rewards, values, dones) * 1e3:9.1f} ms" if transitions <= 100_000 else "  skipped"
+    flat = timed(agent.compute_returns_and_advantages, rewards, values, dones) * 1e3
+    batched = timed(agent.compute_returns_and_advantages,
+                    rewards.view(-1, 100), values.view(-1, 100), dones.view(-1, 100)) * 1e3
+    no_dones = timed(agent.compute_returns_and_advantages, rewards, values, torch.zeros_like(dones)) * 1e3
+    print(f"{transitions:>9} transitions | loop {loop} | vectorized [T, 1] {flat:7.2f} ms"
+          f" | [T/100, 100] {batched:7.2f} ms | no episode ends {no_dones:7.2f} ms")
@@ -0,0 +1,32 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Runs in a fresh interpreter so nothing is already imported
+CHILD = """
+import json, os, time
+import numpy
+
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+rss0 = rss_kb()
+t0 = time.perf_counter()
+from env.poker_env import OnePlayerPokerEnv
+from env.evaluator import score_ids
+t1 = time.perf_counter()
+rss1 = rss_kb()
+score_ids(0, 1, 2, 3, 5)
+t2 = time.perf_counter()
+rss2 = rss_kb()
+print(json.dumps({"import_ms": (t1 - t0) * 1e3, "first_eval_ms": (t2 - t1) * 1e3,
+                  "import_rss_kb": rss1 - rss0, "total_rss_kb": rss2 - rss0}))
+"""
+
+runs = [json.loads(subprocess.run([sys.executable, "-c", CHILD], capture_output=True, text=True,
+                                  check=True, env=os.environ).stdout) for _ in range(15)]
+for key in runs[0]:
+    print(f"{key:>14}: {statistics.median(r[key] for r in runs):8.1f}")
@@ -0,0 +1,53 @@
+import time
+import torch
+import torch.nn.functional as F
+from env.vec_env import VecOnePlayerPokerEnv
+from agent.model import ActorCriticNetwork, PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+from agent.runner import collect_rollouts_batched
+
+torch.manual_seed(0)
+torch.set_num_threads(1)
+
+
+def previous_update(agent, buffer, epochs=4, batch_size=64):
+    """The previous update: fixed minibatch order, separate forwards, sigmoid + log passes."""
+    start_time = time.perf_counter()
+    obs, actions, old_logp = buffer['obs'], buffer['actions'], buffer['log_probs']
+    returns, advantages = agent.compute_returns_and_advantages(buffer['rewards'], buffer['values'], buffer['dones'])
+    advantages = (advantages - advantages.mean()) / (advantages.std() + 1e-8)
+    indices = torch.arange(len(obs))
+    for _ in range(epochs):
+        for start in range(0, len(obs), batch_size):
+            idx = indices[start:start + batch_size]
+            logits = agent.policy_net(obs[idx])
+            probs = torch.sigmoid(logits)
+            logp = (actions[idx] * torch.log(probs + 1e-8) + (1 - actions[idx]) * torch.log(1 - probs + 1e-8)).sum(dim=-1)
+            ratio = torch.exp(logp - old_logp[idx])
+            clipped = torch.clamp(ratio, 1 - agent.clip_eps, 1 + agent.clip_eps)
+            policy_loss = -torch.min(ratio * advantages[idx], clipped * advantages[idx]).mean()
+            value_loss = F.mse_loss(agent.value_net(obs[idx]).squeeze(), returns[idx].squeeze())
+            entropy = -(probs * torch.log(probs + 1e-8) + (1 - probs) * torch.log(1 - probs + 1e-8)).sum(dim=-1).mean()
+            total_loss = policy_loss + agent.value_coef * value_loss - agent.entropy_coef * entropy
+            agent.policy_optimizer.zero_grad()
+            agent.value_optimizer.zero_grad()
+            total_loss.backward()
+            agent.policy_optimizer.step()
+            agent.value_optimizer.step()
+    elapsed = time.perf_counter() - start_time
+    return {'update_time': elapsed, 'samples_per_sec': epochs * len(obs) / elapsed}
+
+
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+buffer = collect_rollouts_batched(VecOnePlayerPokerEnv, policy_net, value_net, num_episodes=2000, num_envs=256)
+print(f"buffer: {buffer.size} transitions, 4 epochs, minibatch 64")
+
+runs = [
+    ("previous update", lambda: previous_update(PPOAgent(PolicyNetwork(), ValueNetwork()), buffer)),
+    ("update, separate nets", lambda: PPOAgent(PolicyNetwork(), ValueNetwork()).update(buffer)),
+    ("update, actor-critic", lambda: PPOAgent(ActorCriticNetwork(), None).update(buffer)),
+]
+for name, run in runs:
+    run()  # warm-up
+    stats = min((run() for _ in range(3)), key=lambda s: s['update_time'])
+    print(f"{name:<22}: {stats['update_time'] * 1e3:7.1f} ms/update, {stats['samples_per_sec']:8.0f} samples/sec")
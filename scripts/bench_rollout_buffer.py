@@ -0,0 +1,45 @@
+import resource
+import subprocess
+import sys
+import time
+import torch
+from collections import defaultdict
+from agent.buffer import RolloutBuffer
+
+# Store synthetic steps shaped like collect_rollouts output the old way and into a RolloutBuffer
+
+
+def measure(mode, steps):
+    # Distinct per-step tensors, as the networks would return, so the list keeps them all alive
+    inputs = [(torch.rand(161), torch.rand(52), torch.rand(()), torch.rand(1)) for _ in range(steps)]
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "list":
+        buffer = defaultdict(list)
+        for t, (obs, action, log_prob, value) in enumerate(inputs):
+            buffer['obs'].append(obs)
+            buffer['actions'].append(action)
+            buffer['log_probs'].append(log_prob)
+            buffer['rewards'].append(torch.tensor([0.5], dtype=torch.float32))
+            buffer['values'].append(value)
+            buffer['dones'].append(torch.tensor([t % 5 == 4], dtype=torch.float32))
+        result = {key: torch.stack(values) for key, values in buffer.items()}
+    else:
+        result = RolloutBuffer(steps)
+        for t, (obs, action, log_prob, value) in enumerate(inputs):
+            result.add(obs, action, log_prob, 0.5, value, t % 5 == 4)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base
+    print(f"{elapsed / steps * 1e6:.2f} {peak / 1024:.1f}")
+
+
+if len(sys.argv) == 3:
+    measure(sys.argv[1], int(sys.argv[2]))
+    sys.exit()
+
+for episodes_per_iter in (150, 2000, 20000):
+    steps = episodes_per_iter * 5
+    for mode, name in (("list", "lists + torch.stack"), ("buffer", "RolloutBuffer")):
+        out = subprocess.run([sys.executable, __file__, mode, str(steps)], capture_output=True, text=True, check=True)
+        us, mb = out.stdout.split()
+        print(f"{episodes_per_iter:>6} episodes, {name:<20}: {float(us):6.2f} us/step, peak +{float(mb):7.1f} MB")
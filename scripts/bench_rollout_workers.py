@@ -0,0 +1,23 @@
+import os
+import time
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.workers import RolloutWorkerPool
+
+env_class = partial(OnePlayerPokerEnv, exact_shaping=True)
+torch.manual_seed(0)
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+num_episodes = 240
+
+print(f"cores: {os.cpu_count()}")
+for num_workers in (1, 2, 4, 8):
+    with RolloutWorkerPool(env_class, policy_net, value_net, num_workers=num_workers,
+                           num_episodes=num_episodes, seed=0) as pool:
+        pool.collect(policy_net, value_net)  # warm up the workers
+        start = time.perf_counter()
+        for _ in range(3):
+            pool.collect(policy_net, value_net)
+        rate = 3 * num_episodes / (time.perf_counter() - start)
+    print(f"{num_workers} workers: {rate:8.0f} episodes/sec")
@@ -0,0 +1,25 @@
+import time
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from env.vec_env import VecOnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.runner import collect_rollouts, collect_rollouts_batched
+
+torch.manual_seed(0)
+torch.set_num_threads(1)
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+
+
+def episodes_per_sec(collect, num_episodes, **kwargs):
+    start = time.perf_counter()
+    collect(policy_net=policy_net, value_net=value_net, num_episodes=num_episodes, **kwargs)
+    return num_episodes / (time.perf_counter() - start)
+
+
+scalar = episodes_per_sec(collect_rollouts, 150, env_class=partial(OnePlayerPokerEnv, exact_shaping=True))
+print(f"collect_rollouts:                     {scalar:8.0f} episodes/sec")
+for num_envs in (16, 64, 256, 1024):
+    rate = episodes_per_sec(collect_rollouts_batched, max(600, 2 * num_envs),
+                            env_class=VecOnePlayerPokerEnv, num_envs=num_envs)
+    print(f"collect_rollouts_batched({num_envs:>4} envs): {rate:8.0f} episodes/sec ({rate / scalar:.1f}x)")
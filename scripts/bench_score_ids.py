@@ -0,0 +1,57 @@
+import random
+import timeit
+from env.evaluator import score_ids
+from env.poker_env import OnePlayerPokerEnv, LOOKUP
+from env.poker_data import FLUSHES, UNIQUE_5, HASH_ADJUST, HASH_VALUES
+
+env = OnePlayerPokerEnv()
+
+
+def legacy_score_hand(hand):
+    """Old score_hand path: (rank, suit) -> string -> LOOKUP, closure rebuilt per call."""
+
+    def hash_function(x):
+        x += 0xe91aaa35
+        x ^= x >> 16
+        x += x << 8
+        x &= 0xffffffff
+        x ^= x >> 4
+        b = (x >> 8) & 0x1ff
+        a = (x + (x << 2)) >> 19
+        r = (a ^ HASH_ADJUST[b]) & 0x1fff
+        return HASH_VALUES[r]
+
+    card_strs = [env.cactus_to_str(rank, suit) for rank, suit in hand]
+    c1, c2, c3, c4, c5 = (LOOKUP[c] for c in card_strs)
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if (0xf000 & c1 & c2 & c3 & c4 & c5):
+        return FLUSHES[q]
+    s = UNIQUE_5[q]
+    if s:
+        return s
+    p = (c1 & 0xff) * (c2 & 0xff) * (c3 & 0xff) * (c4 & 0xff) * (c5 & 0xff)
+    return hash_function(p)
+
+
+random.seed(0)
+hands = [random.sample(range(52), 5) for _ in range(20000)]
+
+assert all(legacy_score_hand(env.ids_to_rank_suit(h)) == score_ids(*h) for h in hands)
+
+
+def run_legacy():
+    for h in hands:
+        legacy_score_hand(env.ids_to_rank_suit(h))
+
+
+def run_score_ids():
+    for h in hands:
+        score_ids(*h)
+
+
+legacy = min(timeit.repeat(run_legacy, number=1, repeat=5)) / len(hands)
+fast = min(timeit.repeat(run_score_ids, number=1, repeat=5)) / len(hands)
+
+print(f"legacy score_hand: {legacy * 1e6:.2f} us/hand")
+print(f"score_ids:         {fast * 1e6:.2f} us/hand")
+print(f"speedup:           {legacy / fast:.1f}x")
@@ -0,0 +1,43 @@
+import random
+import time
+import numpy as np
+from env.poker_env import OnePlayerPokerEnv
+from env.vec_env import VecOnePlayerPokerEnv
+
+
+def random_actions(rng, deck_mask, p=0.3):
+    """Each deck card with probability p, falling back to one random deck card."""
+    noise = rng.random(deck_mask.shape)
+    action = deck_mask & (noise < p)
+    empty = ~action.any(axis=1)
+    action[empty, np.argmax(deck_mask[empty] * noise[empty], axis=1)] = True
+    return action
+
+
+def bench_vec(num_envs, min_steps=20000):
+    rng = np.random.default_rng(0)
+    env = VecOnePlayerPokerEnv(num_envs, seed=0)
+    steps = 0
+    start = time.perf_counter()
+    while steps < min_steps:
+        env.step(random_actions(rng, env.deck_mask))
+        steps += num_envs
+    return steps / (time.perf_counter() - start)
+
+
+def bench_scalar(min_steps=20000):
+    random.seed(0)
+    steps = 0
+    start = time.perf_counter()
+    while steps < min_steps:
+        env = OnePlayerPokerEnv(exact_shaping=True)
+        while not env.done:
+            deck = env.deck
+            env.step([c for c in deck if random.random() < 0.3] or [random.choice(deck)])
+            steps += 1
+    return steps / (time.perf_counter() - start)
+
+
+print(f"scalar OnePlayerPokerEnv:        {bench_scalar():10.0f} env-steps/sec")
+for n in (1, 64, 4096):
+    print(f"VecOnePlayerPokerEnv({n:>4} envs): {bench_vec(n, min_steps=max(20000, 10 * n)):10.0f} env-steps/sec")
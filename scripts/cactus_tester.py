@@ -1,12 +1,13 @@
 from env.card_utils import hand_to_str
 from env.poker_env import OnePlayerPokerEnv
+from env.evaluator import score_ids
 
 env = OnePlayerPokerEnv()
 
 env.player_hand = [0, 9, 22, 35, 48]
 print("Player hand (IDs):", env.player_hand)
 print("Player hand (str):", hand_to_str(env.player_hand))
-player_score = env.score_hand(env.ids_to_rank_suit(env.player_hand))
+player_score = score_ids(*env.player_hand)
 print("Player hand score:", player_score)
 
 # Opponent cards
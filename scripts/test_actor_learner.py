@@ -0,0 +1,28 @@
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+from agent.actor_learner import ActorLearner
+
+torch.manual_seed(0)
+agent = PPOAgent(PolicyNetwork(), ValueNetwork())
+max_staleness = 1
+
+with ActorLearner(partial(OnePlayerPokerEnv, exact_shaping=True), agent, num_actors=2, episodes_per_batch=30,
+                  queue_depth=1, max_staleness=max_staleness, seed=0) as actor_learner:
+    steps = [actor_learner.step() for _ in range(6)]
+    stats = actor_learner.stats()
+    actors = actor_learner.actors
+    version = actor_learner.version.value
+    shared = actor_learner.shared_policy.state_dict()
+alive = any(actor.is_alive() for actor in actors)
+
+# Fresh batches were collected by the learner's own weights, so their importance weights are 1
+fresh = [s['importance_weight'] for s in steps if s['staleness'] == 0]
+published = all(torch.equal(shared[k], v) for k, v in agent.policy_net.state_dict().items())
+
+print(f"Staleness bound:           {'PASS' if max(s['staleness'] for s in steps) <= max_staleness else 'FAIL'}")
+print(f"Fresh importance weights:  {'PASS' if fresh and all(abs(w - 1) < 1e-3 for w in fresh) else 'FAIL'}")
+print(f"Weights published:         {'PASS' if published and version == 6 else 'FAIL'}")
+print(f"Stats and shutdown:        {'PASS' if stats['updates'] == 6 and stats['overlap'] > 0 and not alive else 'FAIL'}")
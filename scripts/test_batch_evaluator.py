@@ -0,0 +1,48 @@
+import itertools
+import numpy as np
+from env.poker_env import OnePlayerPokerEnv
+from env.evaluator import score_hands_batch
+
+env = OnePlayerPokerEnv()
+
+# Every 5-card hand: C(52, 5) = 2,598,960
+hands = np.fromiter(
+    itertools.chain.from_iterable(itertools.combinations(range(52), 5)),
+    dtype=np.int8, count=2598960 * 5,
+).reshape(-1, 5)
+
+batch = score_hands_batch(hands)
+mismatches = 0
+for hand, score in zip(hands.tolist(), batch.tolist()):
+    expected = env.score_hand(env.ids_to_rank_suit(hand))
+    if score != expected:
+        mismatches += 1
+        if mismatches <= 10:
+            print(f"  {hand}: batch {score} != score_hand {expected}")
+
+print(f"Exhaustive batch vs score_hand ({len(hands)} hands): {'PASS' if mismatches == 0 else 'FAIL'}"
+      f" | mismatches: {mismatches}")
+
+# Best-of-N helpers agree with brute force over combinations
+rng = np.random.default_rng(0)
+passed = True
+for n in (5, 6, 7, 8):
+    for _ in range(200):
+        cards = rng.choice(52, n, replace=False).tolist()
+        env.opponent_cards = cards
+        best = min(env.score_hand(env.ids_to_rank_suit(c)) for c in itertools.combinations(cards, 5))
+        score, hand = env.best_opponent_hand_rank()
+        passed &= score == best and env.score_hand(env.ids_to_rank_suit(env.best_5_cards(cards))) == best
+print(f"Best-of-N batch vs brute force: {'PASS' if passed else 'FAIL'}")
+
+# Out-of-range ranks and suits are rejected rather than scored as some other card
+bad_hands = ([(15, 0), (3, 0), (4, 0), (5, 0), (6, 1)], [(1, 0), (3, 0), (4, 0), (5, 0), (6, 1)],
+             [(2, 4), (3, 0), (4, 0), (5, 0), (6, 1)], [(2, -1), (3, 0), (4, 0), (5, 0), (6, 1)],
+             [(2, 0), (3, 0), (4, 0), (5, 0)])
+rejected = 0
+for hand in bad_hands:
+    try:
+        env.score_hand(hand)
+    except ValueError:
+        rejected += 1
+print(f"score_hand rejects bad cards: {'PASS' if rejected == len(bad_hands) else 'FAIL'}")
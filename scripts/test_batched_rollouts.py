@@ -0,0 +1,31 @@
+import torch
+from env.vec_env import VecOnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.runner import collect_rollouts_batched
+
+torch.manual_seed(0)
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+num_episodes = 300
+buffer = collect_rollouts_batched(VecOnePlayerPokerEnv, policy_net, value_net, num_episodes=num_episodes, num_envs=64)
+
+obs, actions, dones = buffer['obs'], buffer['actions'], buffer['dones'].squeeze(1)
+deck = obs[:, :52]
+rounds = obs[:, 156:].argmax(dim=1) + obs[:, 156:].sum(dim=1)
+
+with torch.no_grad():
+    probs = torch.sigmoid(policy_net(obs)) * deck
+    log_probs = (actions * torch.log(probs + 1e-8) + (1 - actions) * torch.log(1 - probs + 1e-8)).sum(dim=1)
+    values = value_net(obs)
+
+# Episodes are contiguous: each starts at round 0 right after a done and ends with a done
+starts = torch.cat([torch.tensor([True]), dones[:-1].bool()])
+checks = {
+    "shapes": (obs.shape[1], actions.shape[1], buffer['rewards'].shape[1], buffer['values'].shape[1]) == (161, 52, 1, 1),
+    "episode count": int(dones.sum()) == num_episodes and dones[-1] == 1,
+    "episodes contiguous": bool(((rounds == 0) == starts).all()),
+    "legal, non-empty actions": bool((actions <= deck).all() and (actions.sum(dim=1) > 0).all()),
+    "log_probs": torch.allclose(log_probs, buffer['log_probs'], atol=1e-4),
+    "values": torch.allclose(values, buffer['values'], atol=1e-5),
+}
+for name, ok in checks.items():
+    print(f"{name}: {'PASS' if ok else 'FAIL'}")
@@ -0,0 +1,34 @@
+import itertools
+import random
+from env.evaluator import best_hand, best_hand_batch, score_ids
+
+random.seed(0)
+
+
+def test_pool_size(n, trials):
+    failures = 0
+    for _ in range(trials):
+        cards = random.sample(range(52), n)
+        score, hand = best_hand(cards)
+        expected, _ = best_hand_batch(cards)
+        if score != expected or score_ids(*hand) != score or len(set(hand)) != 5 or not set(hand) <= set(cards):
+            failures += 1
+    print(f"{n}-card pools: {'PASS' if failures == 0 else 'FAIL'} | failures: {failures}/{trials}")
+
+
+for n in range(5, 13):
+    test_pool_size(n, 20000 if n <= 9 else 2000)
+
+# Crafted pools where several categories compete
+cases = {
+    "Straight flush over quads": [8, 9, 10, 11, 12, 21, 34, 47],
+    "Wheel straight flush": [12, 0, 1, 2, 3, 25, 38],
+    "Quads over flush": [0, 13, 26, 39, 2, 4, 6, 8],
+    "Full house from two trips": [5, 18, 31, 0, 13, 26, 11],
+    "Flush over straight": [0, 2, 4, 6, 8, 14, 16],
+    "Two pair with high kicker pair": [11, 24, 10, 23, 1, 14, 12],
+}
+for name, cards in cases.items():
+    expected = min(score_ids(*c) for c in itertools.combinations(cards, 5))
+    score, hand = best_hand(cards)
+    print(f"{name}: {'PASS' if score == expected else 'FAIL'} | Output: {score}, {hand}")
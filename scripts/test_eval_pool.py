@@ -0,0 +1,95 @@
+import asyncio
+import copy
+import os
+import signal
+import httpx
+from fastapi.testclient import TestClient
+
+from backend_checks import check, report
+import main
+from eval_pool import EvalPool, play_step
+from poker_env.poker_env import OnePlayerPokerEnv
+
+
+# A worker process plays the same move as the server process would
+async def play_both(env, cards):
+    pool, inline = EvalPool(max_workers=1), EvalPool(max_workers=0)
+    try:
+        return await pool.run(play_step, copy.deepcopy(env), cards), await inline.run(play_step, env, cards)
+    finally:
+        pool.shutdown()
+
+
+env = OnePlayerPokerEnv()
+(pooled_env, pooled), (inline_env, inline) = asyncio.run(play_both(env, env.deck[5:8]))
+check("worker result matches in-process step",
+      pooled["observation"] == inline["observation"] and pooled_env.deck == inline_env.deck
+      and pooled_env.player_hand == inline_env.player_hand)
+
+# Past max_pending requests are turned away with 503 and Retry-After
+with TestClient(main.app) as client:
+    session_id = client.get("/reset").json()["session_id"]
+    max_pending = main.eval_pool.max_pending
+    main.eval_pool.max_pending = 0
+    response = client.post("/step", json={"selected_cards": [0]})
+    main.eval_pool.max_pending = max_pending
+    check("503 when full", response.status_code == 503 and response.headers.get("retry-after") == "1",
+          str(response.headers.get("retry-after")))
+    check("rejected step leaves the game alone", main.sessions.get(session_id).env.round == 0)
+
+    # Illegal moves are turned away before reaching a worker
+    client.post("/step", json={"selected_cards": main.sessions.get(session_id).env.deck[:1]})
+    env = main.sessions.get(session_id).env
+    for cards in ([env.deck[0], env.player_hand[0]], [52], [-1]):
+        response = client.post("/step", json={"selected_cards": cards})
+        check(f"illegal move {cards} is 400", response.status_code == 400, response.json()["detail"])
+    check("illegal moves leave the game alone", main.sessions.get(session_id).env.round == 1)
+
+    # A killed worker breaks the pool: the request it broke gets a 503 and later ones a new pool
+    for process in list(main.eval_pool.executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+    round_before = main.sessions.get(session_id).env.round
+    response = client.post("/step", json={"selected_cards": main.sessions.get(session_id).env.deck[:1]})
+    check("broken pool is 503", response.status_code == 503 and response.headers.get("retry-after") == "1",
+          str(response.status_code))
+    response = client.post("/step", json={"selected_cards": main.sessions.get(session_id).env.deck[:1]})
+    check("pool recovers after a worker dies", response.status_code == 200
+          and main.sessions.get(session_id).env.round == round_before + 1 and main.eval_pool.restarts == 1,
+          str(response.status_code))
+
+    try:
+        play_step(OnePlayerPokerEnv(), [52])
+        check("worker rejects illegal moves", False)
+    except ValueError:
+        check("worker rejects illegal moves", True)
+
+
+# Many players at once against a small queue: every request is answered, either played or rejected
+async def burst(players):
+    statuses = []
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async def player():
+            headers = {"X-Session-Id": (await client.get("/reset")).json()["session_id"]}
+            deck = main.sessions.get(headers["X-Session-Id"]).env.deck
+            response = await client.post("/step", json={"selected_cards": deck[:3]}, headers=headers)
+            statuses.append(response.status_code)
+        await asyncio.gather(*(player() for _ in range(players)))
+        metrics = (await client.get("/metrics")).json()
+    return statuses, metrics
+
+
+main.eval_pool.max_pending = 4
+statuses, metrics = asyncio.run(burst(32))
+main.eval_pool.max_pending = max_pending
+main.eval_pool.shutdown()
+played, rejected = statuses.count(200), statuses.count(503)
+check("burst is bounded", played + rejected == 32 and rejected > 0 and played >= 4, f"({played} played, {rejected} rejected)")
+check("nothing left pending", main.eval_pool.pending == 0)
+
+step_latency = metrics["latency"].get("POST /step", {})
+check("latency percentiles", step_latency.get("count", 0) >= 32
+      and 0 < step_latency["p50_ms"] <= step_latency["p95_ms"] <= step_latency["p99_ms"], str(step_latency))
+check("metrics count rejections", metrics["eval_pool"]["rejected"] >= rejected)
+
+report("eval pool")
@@ -0,0 +1,108 @@
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from env.evaluator import expected_score_exact, expected_scores_batch, score_ids
+from env.eval_cache import EVAL_CACHE, EvalCache
+
+
+def brute_force(hand, deck):
+    """Mean score over every completion of hand to 5 cards from deck."""
+    scores = [score_ids(*hand, *extra) for extra in itertools.combinations(deck, 5 - len(hand))]
+    return sum(scores) / len(scores) if scores else 7462.0
+
+
+# Random positions for hand sizes 0-4, on full and short decks. Half the hands are
+# one suit, so the flush correction matters; deck sizes keep enumeration small.
+rng = np.random.default_rng(0)
+states = []
+for i in range(300):
+    size = i % 5
+    if i % 2:
+        suit = rng.integers(4)
+        hand = (suit * 13 + rng.choice(13, size, replace=False)).tolist()
+    else:
+        hand = rng.choice(52, size, replace=False).tolist()
+    rest = [c for c in range(52) if c not in hand]
+    if size >= 2 and i % 3:
+        deck_size = len(rest)
+    else:
+        deck_size = int(rng.integers(0, {0: 22, 1: 28, 2: 36, 3: 47, 4: 48}[size]))
+    states.append((hand, sorted(rng.choice(rest, deck_size, replace=False).tolist())))
+
+EVAL_CACHE.clear()
+EVAL_CACHE.maxsize = 1 << 20
+mismatches = 0
+for hand, deck in states:
+    expected = brute_force(hand, deck)
+    # Twice, so the second answer comes from the cache
+    for _ in range(2):
+        score = expected_score_exact(hand, deck)
+        if not math.isclose(score, expected, rel_tol=1e-12):
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"  hand {hand}, {len(deck)}-card deck: exact {score} != brute force {expected}")
+print(f"Exact vs brute force ({len(states)} states, hand sizes 0-4): {'PASS' if mismatches == 0 else 'FAIL'}"
+      f" | mismatches: {mismatches}")
+
+hands = np.zeros((len(states), 5), dtype=np.int64)
+deck_masks = np.zeros((len(states), 52), dtype=bool)
+for e, (hand, deck) in enumerate(states):
+    hands[e, :len(hand)] = hand
+    deck_masks[e, deck] = True
+hand_sizes = [len(hand) for hand, _ in states]
+expected = np.array([brute_force(hand, deck) for hand, deck in states])
+for enabled in (False, True):
+    EVAL_CACHE.enabled = enabled
+    EVAL_CACHE.clear()
+    passed = np.allclose(expected_scores_batch(hands, hand_sizes, deck_masks), expected, rtol=1e-12)
+    print(f"Batch vs brute force (cache {'on' if enabled else 'off'}): {'PASS' if passed else 'FAIL'}")
+
+# The cache key ignores suit labels: relabelling suits gives the same score from one entry,
+# and it really is the same score by brute force
+EVAL_CACHE.enabled = True
+passed = True
+for hand, deck in states[:100]:
+    perm = rng.permutation(4)
+    relabel = [int(perm[c // 13] * 13 + c % 13) for c in range(52)]
+    hand2, deck2 = [relabel[c] for c in hand], [relabel[c] for c in deck]
+    EVAL_CACHE.clear()
+    score = expected_score_exact(hand, deck)
+    score2 = expected_score_exact(hand2, deck2)
+    passed &= (score2 == score and EVAL_CACHE.hits == 1 and EVAL_CACHE.stats()["size"] == 1
+               and math.isclose(brute_force(hand2, deck2), score, rel_tol=1e-12))
+print(f"Suit-relabelled positions share a cache entry: {'PASS' if passed else 'FAIL'}")
+
+# One cache shared by threads (the server's POKER_WORKERS=0 mode). The entries pause between
+# finding a key and moving it to the end, so without the lock other threads evict it meanwhile
+class SlowReorder(OrderedDict):
+    def move_to_end(self, key, last=True):
+        time.sleep(1e-4)
+        super().move_to_end(key, last)
+
+
+cache = EvalCache(maxsize=8)
+cache._data = SlowReorder()
+errors = []
+
+
+def hammer(seed):
+    keys = np.random.default_rng(seed).integers(0, 32, 2000).tolist()
+    try:
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key)
+    except Exception as e:
+        errors.append(e)
+
+
+threads = [threading.Thread(target=hammer, args=(seed,)) for seed in range(4)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+stats = cache.stats()
+passed = not errors and stats["size"] <= 8 and stats["hits"] + stats["misses"] == 4 * 2000
+print(f"Cache is thread-safe: {'PASS' if passed else 'FAIL'} | {errors[:1] or stats}")
@@ -0,0 +1,44 @@
+import torch
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+
+agent = PPOAgent(PolicyNetwork(), ValueNetwork())
+
+
+def reference(rewards, values, dones, gamma, lam, last_value=0.0):
+    """The original backward loop, one trajectory stream at a time."""
+    returns, advantages = [], []
+    gae = 0
+    next_value = last_value
+    for t in reversed(range(len(rewards))):
+        mask = 1.0 - dones[t].item()
+        delta = rewards[t] + gamma * next_value * mask - values[t]
+        gae = delta + gamma * lam * mask * gae
+        next_value = values[t]
+        advantages.insert(0, gae)
+        returns.insert(0, gae + values[t])
+    return torch.stack(returns), torch.stack(advantages)
+
+
+torch.manual_seed(0)
+failures = 0
+for T, done_p, gamma, lam in [(1, 0.5, 0.99, 1.0), (37, 0.2, 0.99, 1.0), (500, 0.25, 0.99, 0.95), (300, 0.0, 0.9, 0.9)]:
+    # Flat [T, 1] buffers, as collect_rollouts produces
+    rewards, values = torch.randn(T, 1), torch.randn(T, 1)
+    dones = (torch.rand(T, 1) < done_p).float()
+    ret, adv = agent.compute_returns_and_advantages(rewards, values, dones, gamma, lam)
+    ref_ret, ref_adv = reference(rewards, values, dones, gamma, lam)
+    failures += not (torch.allclose(ret, ref_ret, atol=1e-4) and torch.allclose(adv, ref_adv, atol=1e-4))
+
+    # [T, N] layout: every column against the loop, with bootstrapped last values
+    N = 8
+    rewards, values = torch.randn(T, N), torch.randn(T, N)
+    dones = (torch.rand(T, N) < done_p).float()
+    last = torch.randn(N)
+    ret, adv = agent.compute_returns_and_advantages(rewards, values, dones, gamma, lam, last_values=last)
+    for n in range(N):
+        ref_ret, ref_adv = reference(rewards[:, n:n + 1], values[:, n:n + 1], dones[:, n:n + 1], gamma, lam, last[n])
+        failures += not (torch.allclose(ret[:, n], ref_ret[:, 0], atol=1e-4)
+                         and torch.allclose(adv[:, n], ref_adv[:, 0], atol=1e-4))
+
+print(f"Vectorized GAE vs backward loop: {'PASS' if failures == 0 else 'FAIL'} | mismatches: {failures}")
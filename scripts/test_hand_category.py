@@ -0,0 +1,28 @@
+import itertools
+import numpy as np
+from env.poker_env import OnePlayerPokerEnv
+from env.evaluator import score_hands_batch, score_tiebreak, score_tiebreaks_batch
+
+env = OnePlayerPokerEnv()
+
+# Every 5-card hand: C(52, 5) = 2,598,960
+hands = np.fromiter(
+    itertools.chain.from_iterable(itertools.combinations(range(52), 5)),
+    dtype=np.int8, count=2598960 * 5,
+).reshape(-1, 5)
+
+scores = score_hands_batch(hands)
+categories, tiebreaks = score_tiebreaks_batch(scores)
+
+mismatches = 0
+for hand, score, category, tiebreak in zip(hands.tolist(), scores.tolist(), categories.tolist(), tiebreaks.tolist()):
+    expected = env.evaluate_hand(hand)
+    fast = score_tiebreak(score)
+    batch = (category, [r for r in tiebreak if r])
+    if fast != expected or batch != expected:
+        mismatches += 1
+        if mismatches <= 10:
+            print(f"  {hand}: score {score} -> {fast} / {batch}, evaluate_hand {expected}")
+
+print(f"Exhaustive score_tiebreak vs evaluate_hand ({len(hands)} hands): "
+      f"{'PASS' if mismatches == 0 else 'FAIL'} | mismatches: {mismatches}")
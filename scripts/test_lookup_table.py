@@ -0,0 +1,52 @@
+import itertools
+import os
+import tempfile
+import time
+from math import comb
+import numpy as np
+
+# The table directory is read at import, so point it at a scratch directory first
+table_dir = tempfile.TemporaryDirectory()
+os.environ["POKER_TABLE_DIR"] = table_dir.name
+from env.evaluator import best_hand, score_ids
+from env.lookup_table import _unrank, generate_tables, hand_index, load_table, table_path, table_score
+
+# Colex ranks number the k-card sets 0..C(52, k)-1 in order, and _unrank inverts them
+passed = True
+for k in (1, 2, 3):
+    indices = [hand_index(cards) for cards in itertools.combinations(range(52), k)]
+    passed &= sorted(indices) == list(range(comb(52, k)))
+rng = np.random.default_rng(0)
+for k in (5, 6, 7):
+    ranks = rng.integers(0, comb(52, k), 2000)
+    passed &= all(hand_index(cards) == rank for cards, rank in zip(_unrank(ranks, k).tolist(), ranks.tolist()))
+print(f"hand_index is a bijection and _unrank inverts it: {'PASS' if passed else 'FAIL'}")
+
+start = time.time()
+generate_tables({5, 6}, table_dir.name)
+print(f"Generated 5- and 6-card tables in {time.time() - start:.1f}s")
+written = sorted(os.listdir(table_dir.name))
+passed = written == ["best_hand_5.bin", "best_hand_6.bin"]
+print(f"Only the finished tables are written: {'PASS' if passed else 'FAIL'} | {written}")
+table = load_table(6)
+passed = table is not None and table.filename == os.path.realpath(table_path(6, table_dir.name))
+print(f"Tables load from POKER_TABLE_DIR: {'PASS' if passed else 'FAIL'}")
+
+# The 6-card table, built by dropping one card at a time, matches best_hand
+mismatches = 0
+for n in (5, 6):
+    for _ in range(20000 if n == 6 else 5000):
+        cards = rng.choice(52, n, replace=False).tolist()
+        score = table_score(cards)
+        if score != best_hand(cards)[0] or (n == 5 and score != score_ids(*cards)):
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"  {cards}: table {score} != best_hand {best_hand(cards)[0]}")
+print(f"table_score vs best_hand (25000 pools): {'PASS' if mismatches == 0 else 'FAIL'} | mismatches: {mismatches}")
+
+passed = (load_table(7) is None and load_table(8) is None
+          and table_score(rng.choice(52, 7, replace=False).tolist()) is None)
+print(f"Sizes never generated have no table: {'PASS' if passed else 'FAIL'}")
+
+load_table.cache_clear()
+table_dir.cleanup()
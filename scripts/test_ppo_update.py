@@ -0,0 +1,34 @@
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.model import ActorCriticNetwork
+from agent.ppo import PPOAgent, bernoulli_entropy, bernoulli_log_prob
+from agent.runner import collect_rollouts
+
+torch.manual_seed(0)
+
+# Logit-based log-probs and entropy against the sigmoid + log formulas evaluated in float64
+logits = torch.randn(256, 52) * 3
+actions = (torch.rand(256, 52) < 0.5).float()
+probs = torch.sigmoid(logits.double())
+logp = (actions * torch.log(probs) + (1 - actions) * torch.log(1 - probs)).sum(dim=-1)
+entropy = -(probs * torch.log(probs) + (1 - probs) * torch.log(1 - probs)).sum(dim=-1)
+formulas = torch.allclose(bernoulli_log_prob(logits, actions).double(), logp, atol=1e-4) \
+    and torch.allclose(bernoulli_entropy(logits).double(), entropy, atol=1e-4)
+
+# Saturated logits stay finite with finite gradients
+saturated = torch.tensor([[-100.0, 100.0, 0.0]], requires_grad=True)
+value = bernoulli_log_prob(saturated, torch.tensor([[1.0, 0.0, 1.0]])) + bernoulli_entropy(saturated)
+value.sum().backward()
+stable = bool(torch.isfinite(value).all() and torch.isfinite(saturated.grad).all())
+
+# One fused actor-critic update trains the trunk and both heads
+net = ActorCriticNetwork()
+buffer = collect_rollouts(partial(OnePlayerPokerEnv, exact_shaping=True), net, None, num_episodes=30)
+before = {name: p.detach().clone() for name, p in net.named_parameters()}
+stats = PPOAgent(net, None).update(buffer, epochs=1)
+trained = all(not torch.equal(before[name], p) for name, p in net.named_parameters())
+
+print(f"Log-prob and entropy from logits: {'PASS' if formulas else 'FAIL'}")
+print(f"Stable at saturated logits:       {'PASS' if stable else 'FAIL'}")
+print(f"Actor-critic update:              {'PASS' if trained and stats['samples_per_sec'] > 0 else 'FAIL'}")
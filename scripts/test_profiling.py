@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+import time
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.profiling import PROFILER
+from agent.runner import collect_rollouts
+
+torch.manual_seed(0)
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+env_class = partial(OnePlayerPokerEnv, exact_shaping=True)
+original_step = OnePlayerPokerEnv.step
+
+
+def collect_time(repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        collect_rollouts(env_class, policy_net, value_net, num_episodes=60)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Disabled: phases are a shared no-op and nothing is wrapped
+start = time.perf_counter()
+for _ in range(100000):
+    with PROFILER.phase("forward"):
+        pass
+disabled_phase = (time.perf_counter() - start) / 100000
+disabled = collect_time()
+
+with tempfile.TemporaryDirectory() as tmp:
+    log_path = os.path.join(tmp, "phases.jsonl")
+    PROFILER.enable(log_path, profile_iterations=[1])
+    PROFILER.instrument(OnePlayerPokerEnv, "step", "env_step")
+    PROFILER.instrument(OnePlayerPokerEnv, "expected_hand_score", "eval/expected_hand_score")
+    for iteration in range(2):
+        PROFILER.start_iteration(iteration)
+        collect_rollouts(env_class, policy_net, value_net, num_episodes=20)
+        PROFILER.end_iteration(iteration, note="test")
+    enabled = collect_time()
+    PROFILER.disable()
+    records = [json.loads(line) for line in open(log_path)]
+    dumped = os.path.exists(os.path.join(tmp, "profile_iter1.prof"))
+
+phases = records[0]["phases"]
+print(f"JSONL records:      {'PASS' if len(records) == 2 and records[1]['note'] == 'test' else 'FAIL'}")
+print(f"Phases recorded:    {'PASS' if {'env_step', 'eval/expected_hand_score', 'forward', 'sampling'} <= set(phases) and records[0]['env_steps'] == phases['env_step']['calls'] > 0 else 'FAIL'}")
+print(f"cProfile dump:      {'PASS' if dumped else 'FAIL'}")
+print(f"Unwrapped on disable: {'PASS' if OnePlayerPokerEnv.step is original_step and not PROFILER.enabled else 'FAIL'}")
+print(f"disabled phase: {disabled_phase * 1e9:.0f} ns | collect_rollouts(60 episodes): disabled {disabled * 1e3:.0f} ms, enabled {enabled * 1e3:.0f} ms")
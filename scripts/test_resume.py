@@ -0,0 +1,65 @@
+import os
+import random
+import tempfile
+import numpy as np
+import torch
+from env.vec_env import VecOnePlayerPokerEnv
+from agent.checkpoint import CheckpointWriter, capture_training_state, load_checkpoint, restore_training_state
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+from agent.runner import collect_rollouts_batched
+
+
+def new_agent(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    return PPOAgent(PolicyNetwork(), ValueNetwork())
+
+
+def train(agent, iterations, rewards):
+    for _ in range(iterations):
+        buffer = collect_rollouts_batched(VecOnePlayerPokerEnv, agent.policy_net, agent.value_net,
+                                          num_episodes=40, num_envs=16)
+        agent.update(buffer, epochs=2)
+        rewards.append(buffer['rewards'].mean().item())
+
+
+# Uninterrupted run
+straight = new_agent(0)
+straight_rewards = []
+train(straight, 4, straight_rewards)
+
+# Interrupted run: checkpoint after 2 iterations, resume into a differently seeded process state
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "latest.pt")
+    first = new_agent(0)
+    rewards = []
+    train(first, 2, rewards)
+    writer = CheckpointWriter()
+    writer.submit(path, capture_training_state(first, 2, {"reward_history": rewards}))
+    train(first, 1, [])  # keeps training while the write is in flight; must not leak into the checkpoint
+    writer.close()
+    leftovers = [name for name in os.listdir(tmp) if name.endswith(".tmp")]
+
+    resumed = new_agent(123)
+    iteration, metrics = restore_training_state(resumed, load_checkpoint(path))
+    resumed_rewards = metrics["reward_history"]
+    train(resumed, 4 - iteration, resumed_rewards)
+
+
+def same_params(a, b):
+    return all(torch.equal(x, y) for x, y in zip(a.parameters(), b.parameters()))
+
+
+same_optimizer = all(
+    torch.equal(x, y)
+    for opt_a, opt_b in ((straight.policy_optimizer, resumed.policy_optimizer),
+                         (straight.value_optimizer, resumed.value_optimizer))
+    for state_a, state_b in zip(opt_a.state.values(), opt_b.state.values())
+    for x, y in zip(state_a.values(), state_b.values())
+)
+print(f"Bit-for-bit resume (weights):   {'PASS' if same_params(straight.policy_net, resumed.policy_net) and same_params(straight.value_net, resumed.value_net) else 'FAIL'}")
+print(f"Bit-for-bit resume (optimizer): {'PASS' if same_optimizer else 'FAIL'}")
+print(f"Bit-for-bit resume (metrics):   {'PASS' if straight_rewards == resumed_rewards else 'FAIL'}")
+print(f"Atomic writes:                  {'PASS' if not leftovers else 'FAIL'}")
@@ -0,0 +1,30 @@
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.buffer import RolloutBuffer
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.ppo import PPOAgent
+from agent.runner import collect_rollouts
+
+torch.manual_seed(0)
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+buffer = collect_rollouts(partial(OnePlayerPokerEnv, exact_shaping=True), policy_net, value_net, num_episodes=40)
+
+dones = buffer['dones'].squeeze(1)
+ends = (torch.nonzero(dones).squeeze(1) + 1).tolist()
+views = all(buffer[key].data_ptr() == getattr(buffer, key).data_ptr() for key in buffer)
+
+full = RolloutBuffer(1)
+full.add(torch.zeros(161), torch.zeros(52), torch.tensor(0.0), 0.0, torch.zeros(1), False)
+try:
+    full.add(torch.zeros(161), torch.zeros(52), torch.tensor(0.0), 0.0, torch.zeros(1), True)
+    overflow = False
+except RuntimeError:
+    overflow = True
+
+PPOAgent(policy_net, value_net).update(buffer, epochs=1)
+
+print(f"Episode boundaries: {'PASS' if buffer.episode_ends == ends and len(ends) == 40 else 'FAIL'}")
+print(f"Zero-copy views:    {'PASS' if views and len(buffer['obs']) == buffer.size else 'FAIL'}")
+print(f"Overflow raises:    {'PASS' if overflow else 'FAIL'}")
+print("PPO update on buffer: PASS")
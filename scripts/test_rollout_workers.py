@@ -0,0 +1,35 @@
+import torch
+from functools import partial
+from env.poker_env import OnePlayerPokerEnv
+from agent.model import PolicyNetwork, ValueNetwork
+from agent.runner import collect_rollouts
+from agent.workers import RolloutWorkerPool, _seed_all, _worker_seed
+
+env_class = partial(OnePlayerPokerEnv, exact_shaping=True)
+torch.manual_seed(0)
+policy_net, value_net = PolicyNetwork(), ValueNetwork()
+
+
+def pool_rollouts(num_workers, iterations=2):
+    with RolloutWorkerPool(env_class, policy_net, value_net, num_workers=num_workers, num_episodes=50, seed=7) as pool:
+        return [pool.collect(policy_net, value_net) for _ in range(iterations)], pool.episode_split(50)
+
+
+def same(a, b):
+    return all(torch.equal(a[key], b[key]) for key in a)
+
+
+first, split = pool_rollouts(3)
+second, _ = pool_rollouts(3)
+
+# The same seeds in this process: the shared-memory transfer must not change anything
+reference = []
+for worker_id, episodes in enumerate(split):
+    _seed_all(_worker_seed(7, 0, worker_id))
+    reference.append(collect_rollouts(env_class, policy_net, value_net, num_episodes=episodes))
+reference = {key: torch.cat([r[key] for r in reference]) for key in reference[0]}
+
+print(f"Deterministic under a fixed seed: {'PASS' if all(map(same, first, second)) else 'FAIL'}")
+print(f"Matches in-process collection:    {'PASS' if same(first[0], reference) else 'FAIL'}")
+print(f"Episode count:                    {'PASS' if int(first[1]['dones'].sum()) == 50 else 'FAIL'}")
+print(f"New seeds each iteration:         {'PASS' if not same(first[0], first[1]) else 'FAIL'}")
@@ -0,0 +1,93 @@
+import threading
+import time
+from fastapi.testclient import TestClient
+
+from backend_checks import check, report
+import main
+from sessions import SessionStore
+
+
+def env_of(session_id):
+    # Steps run in worker processes, which hand back an updated copy of the env
+    return main.sessions.get(session_id).env
+
+
+# Each client runs the app in its own event loop; requests of one test share one
+with TestClient(main.app) as alice, TestClient(main.app) as bob:
+    # Two players get separate games
+    alice_id = alice.get("/reset").json()["session_id"]
+    bob_id = bob.get("/reset").json()["session_id"]
+    check("distinct sessions", alice_id != bob_id and env_of(alice_id) is not env_of(bob_id))
+
+    alice.post("/step", json={"selected_cards": env_of(alice_id).deck[:3]})
+    check("step only touches its own game", env_of(alice_id).round == 1 and env_of(bob_id).round == 0)
+
+with TestClient(main.app) as anonymous:
+    # The token also works as a header, without the cookie
+    response = anonymous.post("/step", json={"selected_cards": env_of(bob_id).deck[:2]},
+                              headers={"X-Session-Id": bob_id})
+    check("header token", response.status_code == 200 and env_of(bob_id).round == 1)
+    response = anonymous.get("/reset", headers={"X-Session-Id": bob_id})
+    check("reset reuses the session", response.json()["session_id"] == bob_id and env_of(bob_id).round == 0)
+    response = anonymous.post("/step", json={"selected_cards": [0]}, headers={"X-Session-Id": "nope"})
+    check("unknown session is 404", response.status_code == 404)
+
+# Concurrent steps on one session are serialized. Threads race with stale views
+# of the deck, so some steps are rejected with 400, but every accepted one is applied once
+with TestClient(main.app) as client:
+    session_id = client.get("/reset").json()["session_id"]
+    accepted, statuses = [], set()
+
+    def play():
+        for _ in range(20):
+            env = env_of(session_id)
+            if env.done or not env.deck:
+                return
+            status = client.post("/step", json={"selected_cards": env.deck[:1]}).status_code
+            statuses.add(status)
+            if status == 200:
+                accepted.append(1)
+
+    threads = [threading.Thread(target=play) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+env = env_of(session_id)
+seen = env.player_hand + env.opponent_cards + env.deck
+check("concurrent steps keep the game consistent", sorted(seen) == list(range(52)) and len(accepted) == env.round
+      and statuses <= {200, 400}, f"({len(accepted)} accepted, {env.round} rounds, statuses {sorted(statuses)})")
+
+# LRU cap and idle TTL, on a fake clock
+now = [0.0]
+store = SessionStore(object, max_sessions=3, ttl=10.0, clock=lambda: now[0])
+first, second, third = store.create(), store.create(), store.create()
+now[0] = 1.0
+store.get(first.id)
+fourth = store.create()
+check("LRU eviction at the cap", len(store) == 3 and store.get(second.id) is None and store.get(first.id) is first,
+      str(store.stats()))
+
+now[0] = 20.0
+check("idle sessions expire", store.get(third.id) is None)
+store.create()
+check("expired sessions are dropped on create", len(store) == 1 and store.get(fourth.id) is None, str(store.stats()))
+
+# The server sweeps out idle games on its own, without waiting for another request
+ttl = main.sessions.ttl
+main.sessions.ttl = 0.05
+with TestClient(main.app) as client:
+    idle_id = client.get("/reset").json()["session_id"]
+    expired = main.sessions.expired
+    time.sleep(0.5)
+    check("idle sessions are swept", idle_id not in main.sessions._sessions and main.sessions.expired > expired,
+          str(main.sessions.stats()))
+main.sessions.ttl = ttl
+
+# Memory stays bounded under many visitors
+store = SessionStore(main.OnePlayerPokerEnv, max_sessions=100)
+for _ in range(1000):
+    store.create()
+check("hard cap", len(store) == 100 and store.stats()["evicted"] == 900)
+
+report("session")
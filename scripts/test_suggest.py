@@ -0,0 +1,85 @@
+import asyncio
+import os
+import tempfile
+import httpx
+import torch
+from fastapi.testclient import TestClient
+
+from backend_checks import check, report
+import main
+from agent.model import ActorCriticNetwork
+from agent.runner import encode_observation
+from policy_server import PolicyServer
+
+
+server = main.policy_server
+check("policy loaded", server is not None)
+
+
+def expected(obs_dict):
+    with torch.no_grad():
+        obs = encode_observation(obs_dict)
+        probs = torch.sigmoid(server.logits(obs)) * obs[:52]
+    cards = [i for i in range(52) if probs[i] > 0.5] or [int(probs.argmax())]
+    return cards, probs
+
+
+with TestClient(main.app) as client:
+    session_id = client.get("/reset").json()["session_id"]
+    env = main.sessions.get(session_id).env
+    response = client.get("/suggest").json()
+    cards, probs = expected(env.get_observation())
+    check("suggestion matches the policy", response["selected_cards"] == cards
+          and torch.allclose(torch.tensor(response["probabilities"]), probs, atol=1e-6))
+    check("only legal cards", all(card in env.deck for card in response["selected_cards"]))
+
+    client.post("/step", json={"selected_cards": response["selected_cards"]})
+    env = main.sessions.get(session_id).env
+    if not env.done:
+        cards, _ = expected(env.get_observation())
+        check("follows the game", client.get("/suggest").json()["selected_cards"] == cards)
+    while not env.done:
+        client.post("/step", json={"selected_cards": env.deck[:1]})
+        env = main.sessions.get(session_id).env
+    check("finished game is 400", client.get("/suggest").status_code == 400)
+    check("unknown session is 404", client.get("/suggest", headers={"X-Session-Id": "nope"}).status_code == 404)
+
+
+# Concurrent requests share forward passes, and batching doesn't change any answer
+async def burst(players):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async def player():
+            headers = {"X-Session-Id": (await client.get("/reset")).json()["session_id"]}
+            obs = main.sessions.get(headers["X-Session-Id"]).env.get_observation()
+            return obs, (await client.get("/suggest", headers=headers)).json()
+        results = await asyncio.gather(*(player() for _ in range(players)))
+        metrics = (await client.get("/metrics")).json()["suggest"]
+    return results, metrics
+
+
+server.batch_sizes.clear()
+results, metrics = asyncio.run(burst(100))
+mismatches = sum(response["selected_cards"] != expected(obs)[0] for obs, response in results)
+check("batched answers match single ones", mismatches == 0, f"({mismatches} mismatches)")
+check("requests are batched", metrics["requests"] == 100 and metrics["mean_batch_size"] > 1
+      and max(int(size) for size in metrics["batch_sizes"]) <= server.max_batch_size, str(metrics["batch_sizes"]))
+check("latency metrics", {"forward", "request"} <= metrics["latency"].keys(), str(metrics["latency"].get("request")))
+main.eval_pool.shutdown()
+
+# Shared-trunk checkpoints load too; anything unloadable disables /suggest instead of failing
+with tempfile.TemporaryDirectory() as tmp:
+    actor_critic = ActorCriticNetwork()
+    torch.save(actor_critic.state_dict(), os.path.join(tmp, "actor_critic.pth"))
+    loaded = PolicyServer.load(os.path.join(tmp, "actor_critic.pth"))
+    obs = encode_observation(main.OnePlayerPokerEnv().get_observation()).unsqueeze(0)
+    with torch.no_grad():
+        check("actor-critic checkpoint", loaded is not None and torch.equal(loaded.logits(obs), actor_critic(obs)[0]))
+
+    with open(os.path.join(tmp, "broken.pth"), "wb") as f:
+        f.write(b"not a checkpoint")
+    torch.save({"fc1.weight": torch.zeros(3)}, os.path.join(tmp, "wrong.pth"))
+    check("unloadable checkpoints are skipped", PolicyServer.load(os.path.join(tmp, "broken.pth")) is None
+          and PolicyServer.load(os.path.join(tmp, "wrong.pth")) is None)
+
+report("suggest")
@@ -0,0 +1,48 @@
+import numpy as np
+from env.poker_env import OnePlayerPokerEnv
+from env.vec_env import VecOnePlayerPokerEnv
+
+# Step the vectorized env and one scalar env per game on the same deck orders and actions
+num_envs = 64
+rng = np.random.default_rng(0)
+vec_env = VecOnePlayerPokerEnv(num_envs, seed=1)
+
+
+def scalar_from(order):
+    env = OnePlayerPokerEnv(exact_shaping=True)
+    env.deck = order.tolist()
+    return env
+
+
+envs = [scalar_from(vec_env.order[i]) for i in range(num_envs)]
+failures = 0
+games = 0
+for _ in range(300):
+    # Narrow and wide action subsets, occasionally empty
+    action = vec_env.deck_mask & (rng.random((num_envs, 52)) < rng.choice([0.0, 0.05, 0.3, 0.8], (num_envs, 1)))
+    obs, rewards, dones, infos = vec_env.step(action)
+    final = infos["final_observation"]
+
+    for i, env in enumerate(envs):
+        _, reward, done, _ = env.step(np.flatnonzero(action[i]).tolist())
+        expected = env.get_observation()
+        same = (
+            reward == rewards[i] and done == dones[i]
+            and expected["deck_mask"] == int((final["deck_mask"][i] << np.arange(52)).sum())
+            and expected["hand_mask"] == int((final["hand_mask"][i] << np.arange(52)).sum())
+            and expected["opponent_mask"] == int((final["opponent_mask"][i] << np.arange(52)).sum())
+            and expected["round"] == final["round"][i]
+        )
+        failures += not same
+        if done:
+            games += 1
+            envs[i] = scalar_from(vec_env.order[i])
+
+print(f"Vectorized vs scalar env ({games} games): {'PASS' if failures == 0 else 'FAIL'} | mismatched steps: {failures}")
+
+# Assigning the hand or the opponent's cards directly keeps the observation masks in step
+env = OnePlayerPokerEnv()
+env.player_hand, env.opponent_cards = [0, 9, 22], [1, 2, 3, 4, 5, 6, 7]
+obs = env.get_observation()
+passed = obs["hand_mask"] == (1 << 0 | 1 << 9 | 1 << 22) and obs["opponent_mask"] == (1 << 8) - 2
+print(f"Assigned hands update the masks: {'PASS' if passed else 'FAIL'}")
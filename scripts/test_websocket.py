@@ -0,0 +1,75 @@
+from fastapi.testclient import TestClient
+
+from backend_checks import check, report
+import main
+
+
+with TestClient(main.app) as client:
+    with client.websocket_connect("/ws") as ws:
+        hello = ws.receive_json()
+        session_id = hello["session_id"]
+        check("new game on connect", hello["type"] == "reset" and main.sessions.get(session_id) is not None)
+
+        # Replaying the deltas rebuilds exactly the state of the game
+        hand, discarded, moves = [], [], 0
+        while True:
+            env = main.sessions.get(session_id).env
+            ws.send_json({"type": "step", "cards": env.deck[2:4]})
+            delta = ws.receive_json()
+            moves += 1
+            if delta["card"] is not None:
+                hand.append(delta["card"])
+            discarded += delta["discarded"]
+            if delta["done"]:
+                break
+        env = main.sessions.get(session_id).env
+        check("deltas add up to the game", hand == env.player_hand and discarded == env.opponent_cards
+              and moves == env.round, f"({moves} moves)")
+        result = delta["result"]
+        check("terminal result", len(result["player_best_hand"]) == 5 and result["opponent_hand_rank"] != ""
+              and delta["reward"] == env.get_reward())
+
+        ws.send_json({"type": "step", "cards": [0]})
+        check("move after the end is an error", ws.receive_json()["type"] == "error")
+
+        ws.send_json({"type": "reset"})
+        reset = ws.receive_json()
+        env = main.sessions.get(session_id).env
+        check("reset restarts the same session", reset == {"type": "reset", "session_id": session_id}
+              and env.round == 0 and len(env.deck) == 52)
+
+        ws.send_json({"type": "step", "cards": [99]})
+        check("invalid move is an error", ws.receive_json()["type"] == "error")
+        ws.send_json({"type": "step", "cards": 3})
+        check("malformed move is an error", ws.receive_json()["type"] == "error")
+        ws.send_text("not json")
+        check("malformed message is an error", ws.receive_json()["type"] == "error")
+
+        # The session also serves HTTP requests such as /suggest
+        response = client.get("/suggest", headers={"X-Session-Id": session_id})
+        check("session works over HTTP", response.status_code in (200, 503), str(response.status_code))
+
+        max_pending = main.eval_pool.max_pending
+        main.eval_pool.max_pending = 0
+        ws.send_json({"type": "step", "cards": env.deck[:1]})
+        busy = ws.receive_json()
+        main.eval_pool.max_pending = max_pending
+        check("busy server asks to retry", busy["type"] == "error" and busy.get("retry_after") == 1)
+
+        main.sessions.remove(session_id)
+        ws.send_json({"type": "step", "cards": env.deck[:1]})
+        expired = ws.receive_json()
+        check("expired game asks for a reset", expired["type"] == "error" and expired.get("expired") is True)
+        ws.send_json({"type": "reset"})
+        session_id = ws.receive_json()["session_id"]
+        env = main.sessions.get(session_id).env
+
+        ws.send_json({"type": "step", "cards": env.deck[:1]})
+        delta = ws.receive_json()
+        check("first move after reset", delta["type"] == "step" and delta["card"] == env.deck[0]
+              and delta["discarded"] == [])
+
+    check("session dropped on disconnect", main.sessions.get(session_id) is None)
+    check("socket latency recorded", "WS step" in client.get("/metrics").json()["latency"])
+
+report("websocket")
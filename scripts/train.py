@@ -1,54 +1,178 @@
+import argparse
 import os
-import json
+import random
+import numpy as np
 import torch
+from functools import partial
 
+import env.poker_env
+import env.vec_env
 from env.poker_env import OnePlayerPokerEnv
-from agent.model import PolicyNetwork, ValueNetwork
-from agent.runner import collect_rollouts
+from env.vec_env import VecOnePlayerPokerEnv
+from env.eval_cache import EVAL_CACHE
+from agent.model import ActorCriticNetwork, PolicyNetwork, ValueNetwork
+from agent.runner import collect_rollouts, collect_rollouts_batched
+from agent.workers import RolloutWorkerPool
+from agent.actor_learner import ActorLearner
 from agent.ppo import PPOAgent
+from agent.profiling import PROFILER
+from agent.checkpoint import (CheckpointWriter, capture_training_state, cpu_state_dict, load_checkpoint,
+                              restore_training_state)
 
 # === Config ===
 num_iterations = 1000
 episodes_per_iter = 150
+num_envs = 64  # games stepped together by the batched collector (exact shaping only)
+num_workers = 0  # > 0 collects with that many worker processes instead
+seed = 0  # seeds random, numpy and torch, and the worker pool's rollouts
+async_actors = 0  # > 0 trains asynchronously: actor processes collect while the learner updates
+queue_depth = 2  # filled batches allowed to wait for the learner
+max_staleness = 2  # batches collected more than this many weight versions ago are dropped
+publish_every = 1  # learner updates between weight publications to the actors
+behavior_clip = 2.0  # truncation of importance ratios to the actors' stale policy
 save_every = 250
+checkpoint_every = 25  # iterations between full-state checkpoints (latest.pt)
 checkpoint_dir = "checkpoints-m1"
+exact_shaping = True  # exact expected-score reward shaping instead of 100-sample Monte Carlo
+shared_trunk = False  # one actor-critic network (one forward pass) instead of separate policy/value nets
+eval_cache_snapshot = f"{checkpoint_dir}/eval_cache.pkl"
+profile_log = None  # e.g. f"{checkpoint_dir}/phases.jsonl": per-iteration phase timings (this process only)
+profile_iterations = []  # iterations to run under cProfile when profile_log is set
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--resume", nargs="?", const=f"{checkpoint_dir}/latest.pt", default=None,
+                    help="continue from a full-state checkpoint (default: latest.pt in the checkpoint dir)")
+args = parser.parse_args()
 
 # === Setup ===
 os.makedirs(checkpoint_dir, exist_ok=True)
+if profile_log:
+    PROFILER.enable(profile_log, profile_iterations)
+    PROFILER.instrument(OnePlayerPokerEnv, "step", "env_step")
+    PROFILER.instrument(VecOnePlayerPokerEnv, "step", "env_step", units=lambda self, action_mask: self.num_envs)
+    # Reward computation per env, inclusive of the hand evaluation below
+    for method in ("expected_hand_score", "best_opponent_score"):
+        PROFILER.instrument(OnePlayerPokerEnv, method, f"reward/{method}")
+    PROFILER.instrument(VecOnePlayerPokerEnv, "_terminal_rewards", "reward/terminal_rewards",
+                        units=lambda self, env_ids: len(env_ids))
+    # Evaluator entry points, wrapped where the envs look them up; these eval/ phases make up eval_calls
+    batch_units = {"score_hands_batch": lambda hands, *args, **kwargs: len(hands),
+                   "expected_scores_batch": lambda hands, *args, **kwargs: len(hands)}
+    for module in (env.poker_env, env.vec_env):
+        for name in ("score_ids", "score_hands_batch", "best_hand", "table_score", "expected_score_exact",
+                     "expected_scores_batch"):
+            if hasattr(module, name):
+                PROFILER.instrument(module, name, f"eval/{name}", units=batch_units.get(name))
+    PROFILER.instrument(PPOAgent, "update", "ppo_update")
+random.seed(seed)
+np.random.seed(seed)
+torch.manual_seed(seed)
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+EVAL_CACHE.load(eval_cache_snapshot)
 
-policy_net = PolicyNetwork().to(device)
-value_net = ValueNetwork().to(device)
+if shared_trunk:
+    policy_net = ActorCriticNetwork().to(device)
+    value_net = None
+else:
+    policy_net = PolicyNetwork().to(device)
+    value_net = ValueNetwork().to(device)
 agent = PPOAgent(policy_net, value_net)
 
+# Resuming restores the networks, both optimizers, the RNG states and the metrics
+start_iteration = 0
 reward_history = []
+if args.resume:
+    start_iteration, metrics = restore_training_state(agent, load_checkpoint(args.resume))
+    reward_history = metrics["reward_history"]
+    print(f"Resumed from {args.resume} at iteration {start_iteration}")
+
+# Checkpoints are captured on this thread and written to disk by a background thread
+checkpoint_writer = CheckpointWriter()
+
+
+def save_models(suffix=""):
+    if value_net is None:
+        checkpoint_writer.submit(f"{checkpoint_dir}/actor_critic{suffix}.pth", cpu_state_dict(policy_net))
+    else:
+        checkpoint_writer.submit(f"{checkpoint_dir}/policy{suffix}.pth", cpu_state_dict(policy_net))
+        checkpoint_writer.submit(f"{checkpoint_dir}/value{suffix}.pth", cpu_state_dict(value_net))
+
+
+def save_checkpoint(iteration):
+    state = capture_training_state(agent, iteration, {"reward_history": reward_history})
+    checkpoint_writer.submit(f"{checkpoint_dir}/latest.pt", state)
+    checkpoint_writer.submit(f"{checkpoint_dir}/reward_history.json", state["metrics"]["reward_history"])
+
+worker_pool = None
+actor_learner = None
+if async_actors > 0:
+    actor_learner = ActorLearner(partial(OnePlayerPokerEnv, exact_shaping=exact_shaping), agent,
+                                 num_actors=async_actors, episodes_per_batch=episodes_per_iter,
+                                 queue_depth=queue_depth, max_staleness=max_staleness,
+                                 publish_every=publish_every, behavior_clip=behavior_clip, seed=seed)
+elif num_workers > 0:
+    worker_pool = RolloutWorkerPool(partial(OnePlayerPokerEnv, exact_shaping=exact_shaping), policy_net, value_net,
+                                    num_workers=num_workers, num_episodes=episodes_per_iter, seed=seed)
+    worker_pool.iteration = start_iteration
 
 # === Training loop ===
-for iteration in range(num_iterations):
-    buffer = collect_rollouts(
-        env_class=OnePlayerPokerEnv,
-        policy_net=policy_net,
-        value_net=value_net,
-        num_episodes=episodes_per_iter,
-        device=device
-    )
-
-    agent.update(buffer)
-
-    total_reward = buffer["rewards"].sum().item()
-    avg_reward = buffer["rewards"].mean().item()
+for iteration in range(start_iteration, num_iterations):
+    PROFILER.start_iteration(iteration)
+    if actor_learner is not None:
+        update_stats = actor_learner.step(device=device)
+        total_reward = update_stats["rewards_sum"]
+        avg_reward = update_stats["rewards_mean"]
+    else:
+        if worker_pool is not None:
+            buffer = worker_pool.collect(policy_net, value_net, device=device)
+        elif exact_shaping:
+            buffer = collect_rollouts_batched(
+                env_class=VecOnePlayerPokerEnv,
+                policy_net=policy_net,
+                value_net=value_net,
+                num_episodes=episodes_per_iter,
+                num_envs=num_envs,
+                device=device
+            )
+        else:
+            buffer = collect_rollouts(
+                env_class=partial(OnePlayerPokerEnv, exact_shaping=exact_shaping),
+                policy_net=policy_net,
+                value_net=value_net,
+                num_episodes=episodes_per_iter,
+                device=device
+            )
+
+        update_stats = agent.update(buffer)
+        total_reward = buffer["rewards"].sum().item()
+        avg_reward = buffer["rewards"].mean().item()
     reward_history.append(avg_reward)
+    PROFILER.end_iteration(iteration, total_reward=total_reward, avg_reward=avg_reward)
 
-    print(f"Iter {iteration} — total reward: {total_reward:.2f} | avg: {avg_reward:.2f}")
+    cache_stats = EVAL_CACHE.stats()
+    print(f"Iter {iteration} — total reward: {total_reward:.2f} | avg: {avg_reward:.2f}"
+          f" | eval cache hit rate: {cache_stats['hit_rate']:.1%} ({cache_stats['evictions']} evictions)"
+          f" | update: {update_stats['update_time'] * 1e3:.0f} ms ({update_stats['samples_per_sec']:.0f} samples/sec)")
 
     if iteration > 0 and iteration % save_every == 0:
-        torch.save(policy_net.state_dict(), f"{checkpoint_dir}/policy_iter{iteration}.pth")
-        torch.save(value_net.state_dict(), f"{checkpoint_dir}/value_iter{iteration}.pth")
+        save_models(f"_iter{iteration}")
         print(f"[Checkpoint saved @ iter {iteration}]")
+    if (iteration + 1) % checkpoint_every == 0:
+        save_checkpoint(iteration + 1)
+
+if worker_pool is not None:
+    worker_pool.close()
+if actor_learner is not None:
+    async_stats = actor_learner.stats()
+    actor_learner.close()
+    print(f"Async training: overlap {async_stats['overlap']:.2f}, learner utilization"
+          f" {async_stats['learner_utilization']:.0%}, mean staleness {async_stats['mean_staleness']:.2f},"
+          f" {async_stats['dropped_batches']} stale batches dropped")
 
 # === Final save ===
-torch.save(policy_net.state_dict(), f"{checkpoint_dir}/policy.pth")
-torch.save(value_net.state_dict(), f"{checkpoint_dir}/value.pth")
-with open(f"{checkpoint_dir}/reward_history.json", "w") as f:
-    json.dump(reward_history, f)
+save_models()
+save_checkpoint(num_iterations)
+checkpoint_writer.close()
+if EVAL_CACHE.enabled:
+    EVAL_CACHE.save(eval_cache_snapshot)
 print("✅ Final models and reward history saved.")